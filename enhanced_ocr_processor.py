@@ -15,6 +15,8 @@ import json
 import cv2
 from tqdm import tqdm
 import logging
+import os
+import tempfile
 from utils.path_utils import ensure_long_path
 from image_preprocessor import preprocess_image_for_ocr, cleanup_temp_files
 from config.settings import min_ocr_confidence, tesseract_config
@@ -25,6 +27,9 @@ logger = logging.getLogger(__name__)
 # Set Tesseract path for Windows
 pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
+# Images per Tesseract run in list-file mode; very long lists have been reported to hang
+OCR_LIST_BATCH_SIZE = 40
+
 
 class EnhancedOCRProcessor:
     """Smart OCR that extracts sender/recipient and formats text properly"""
@@ -78,12 +83,16 @@ class EnhancedOCRProcessor:
         
         return Image.fromarray(enhanced)
     
-    def extract_text_with_layout(self, image):
-        """Extract text preserving layout and spacing"""
+    def extract_text_with_layout(self, image, data=None):
+        """Extract text preserving layout and spacing
+        
+        data: image_to_data output already computed for this image, to avoid running Tesseract again
+        """
         # Use enhanced Tesseract configuration
         
         # Get detailed data with coordinates
-        data = pytesseract.image_to_data(image, config=tesseract_config, output_type=pytesseract.Output.DICT)
+        if data is None:
+            data = pytesseract.image_to_data(image, config=tesseract_config, output_type=pytesseract.Output.DICT)
         
         # Reconstruct text with proper spacing
         lines = {}
@@ -265,45 +274,7 @@ class EnhancedOCRProcessor:
             # NEW: Get confidence data for quality control
             data = pytesseract.image_to_data(processed_img, config=tesseract_config, output_type=pytesseract.Output.DICT)
             
-            # Calculate average confidence of text lines
-            confidences = [c for c, t in zip(data['conf'], data['text']) if t.strip() and c > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-            
-            # Also get layout-aware text as backup
-            layout_text = self.extract_text_with_layout(processed_img)
-            
-            # Use whichever is longer/better
-            text = layout_text if len(layout_text) > len(raw_text) else raw_text
-            
-            if not text.strip():
-                return None
-            
-            # Detect sender/recipient
-            filename = Path(image_path).name
-            sender, recipient = self.detect_sender_recipient(text, filename)
-            
-            # Format message text
-            formatted_text = self.format_message_text(text)
-            
-            # NEW: Determine processing status based on confidence
-            status = "SUCCESS"
-            if avg_confidence < min_ocr_confidence:
-                status = "LOW_CONFIDENCE_FLAG"
-                logger.warning(f"Low confidence ({avg_confidence:.1f}%) for {filename}")
-            
-            result = {
-                'filename': filename,
-                'filepath': str(image_path),
-                'sender': sender,
-                'recipient': recipient,
-                'raw_text': text,
-                'formatted_text': formatted_text,
-                'confidence': round(avg_confidence, 2),
-                'processing_status': status,
-                'char_count': len(formatted_text),
-                'has_sender': sender != "Unknown",
-                'has_recipient': recipient != "Unknown"
-            }
+            result = self._build_result(image_path, raw_text, data)
             
             # Clean up temporary file
             cleanup_temp_files(temp_path, image_path)
@@ -319,6 +290,101 @@ class EnhancedOCRProcessor:
             
             return None
     
+    def _build_result(self, image_path, raw_text, data):
+        """Build the result row for one image from its Tesseract text and word data"""
+        # Calculate average confidence of text lines
+        confidences = [c for c, t in zip(data['conf'], data['text']) if t.strip() and c > 0]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        
+        # Also get layout-aware text as backup (reuses the word data above)
+        layout_text = self.extract_text_with_layout(None, data)
+        
+        # Use whichever is longer/better
+        text = layout_text if len(layout_text) > len(raw_text) else raw_text
+        
+        if not text.strip():
+            return None
+        
+        # Detect sender/recipient
+        filename = Path(image_path).name
+        sender, recipient = self.detect_sender_recipient(text, filename)
+        
+        # Format message text
+        formatted_text = self.format_message_text(text)
+        
+        # NEW: Determine processing status based on confidence
+        status = "SUCCESS"
+        if avg_confidence < min_ocr_confidence:
+            status = "LOW_CONFIDENCE_FLAG"
+            logger.warning(f"Low confidence ({avg_confidence:.1f}%) for {filename}")
+        
+        return {
+            'filename': filename,
+            'filepath': str(image_path),
+            'sender': sender,
+            'recipient': recipient,
+            'raw_text': text,
+            'formatted_text': formatted_text,
+            'confidence': round(avg_confidence, 2),
+            'processing_status': status,
+            'char_count': len(formatted_text),
+            'has_sender': sender != "Unknown",
+            'has_recipient': recipient != "Unknown"
+        }
+    
+    @staticmethod
+    def _split_data_by_page(data, page_count):
+        """Split list-file image_to_data output into one dict per image by page_num"""
+        pages = [{key: [] for key in data} for _ in range(page_count)]
+        for i, page_num in enumerate(data['page_num']):
+            page = int(page_num) - 1
+            if not 0 <= page < page_count:
+                return None
+            for key, values in data.items():
+                pages[page][key].append(values[i])
+        return pages
+    
+    def process_images(self, image_paths):
+        """Process a batch of images, passing them to Tesseract together as a list file.
+        
+        Returns one result (or None) per image, in order. Falls back to
+        process_image for each file if the output can't be split per image.
+        """
+        if len(image_paths) < 2:
+            return [self.process_image(p) for p in image_paths]
+        
+        temp_paths = []
+        try:
+            for image_path in image_paths:
+                temp_paths.append(preprocess_image_for_ocr(image_path))
+            
+            # Tesseract reads a .txt input as a list of images, one path per line
+            with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as list_file:
+                list_file.write('\n'.join(str(p) for p in temp_paths) + '\n')
+            try:
+                raw_output = pytesseract.image_to_string(list_file.name, config=tesseract_config)
+                data = pytesseract.image_to_data(list_file.name, config=tesseract_config, output_type=pytesseract.Output.DICT)
+            finally:
+                os.remove(list_file.name)
+            
+            # Pages are separated by form feeds, with one after the last page too
+            pages = raw_output.split('\f')
+            if len(pages) == len(image_paths) + 1 and not pages[-1].strip():
+                pages.pop()
+            page_data = self._split_data_by_page(data, len(image_paths))
+            if len(pages) != len(image_paths) or page_data is None:
+                raise ValueError(f"got {len(pages)} pages for {len(image_paths)} images")
+            
+            return [self._build_result(p, text, d) for p, text, d in zip(image_paths, pages, page_data)]
+            
+        except Exception as e:
+            logger.warning(f"Batch OCR failed, processing {len(image_paths)} images one by one: {e}")
+            return [self.process_image(p) for p in image_paths]
+            
+        finally:
+            for temp_path, image_path in zip(temp_paths, image_paths):
+                cleanup_temp_files(temp_path, image_path)
+    
     def process_directory(self, input_dir, output_csv):
         """Process all images in directory"""
         input_path = Path(input_dir)
@@ -332,10 +398,11 @@ class EnhancedOCRProcessor:
         logger.info(f"Found {len(image_files)} images to process")
         
         results = []
-        for img_path in tqdm(image_files, desc="Processing images"):
-            result = self.process_image(img_path)
-            if result:
-                results.append(result)
+        with tqdm(total=len(image_files), desc="Processing images") as progress:
+            for start in range(0, len(image_files), OCR_LIST_BATCH_SIZE):
+                batch = image_files[start:start + OCR_LIST_BATCH_SIZE]
+                results.extend(r for r in self.process_images(batch) if r)
+                progress.update(len(batch))
         
         # Create DataFrame
         df = pd.DataFrame(results)
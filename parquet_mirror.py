@@ -0,0 +1,70 @@
+"""
+Parquet copies of slow-to-parse data files.
+
+Shared by the dashboard CSV loaders, the exhibit loader and the OCR result
+writers: pyarrow detection, an atomic writer, and a loader that keeps a
+Parquet mirror next to a source file and rebuilds it when the source changes.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Mixed-type columns Arrow can't store, a pyarrow build without the requested
+# codec, or an unwritable folder
+PARQUET_ERRORS = (OSError, ValueError, TypeError, NotImplementedError)
+
+
+def write_parquet(df, path, **kwargs):
+    """Write df to path through a .tmp file so readers never see a partial file.
+
+    Raises one of PARQUET_ERRORS on failure, with the temporary file removed.
+    """
+    tmp = Path(f"{path}.tmp")
+    try:
+        df.to_parquet(tmp, **kwargs)
+        os.replace(tmp, path)
+    except PARQUET_ERRORS:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def mirror_path(source, version):
+    """Mirror file for source; the version is part of the name, so bumping it
+    (after a parser or schema change) retires every mirror written before."""
+    source = Path(source)
+    return source.with_name(f"{source.stem}.v{version}.parquet")
+
+
+def load_with_mirror(source, build, version, columns=None):
+    """Load source through its Parquet mirror, rebuilding the mirror when stale.
+
+    build() parses the source into a DataFrame; it runs when there is no mirror
+    at least as new as the source (or no pyarrow). columns, if given, limits the
+    result to those of its names the data actually has.
+    """
+    if HAS_PYARROW:
+        mirror = mirror_path(source, version)
+        try:
+            if mirror.stat().st_mtime >= os.stat(source).st_mtime:
+                names = pq.read_schema(mirror).names
+                return pd.read_parquet(mirror, columns=[c for c in names if c in columns] if columns else None)
+        except PARQUET_ERRORS:
+            # No mirror yet, or a damaged one: rebuild from the source
+            pass
+
+    df = build()
+    if HAS_PYARROW:
+        try:
+            write_parquet(df, mirror)
+        except PARQUET_ERRORS:
+            # Serve this load from the parsed frame; the next one tries again
+            pass
+    return df[[c for c in df.columns if c in columns]] if columns else df
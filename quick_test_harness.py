@@ -135,7 +135,23 @@ def main():
         20
     ))
     
-    # Test 7: Directory structure validation
+    # Test 7: Blank-frame detection must not skip sparse text screenshots
+    print("🖼️ OCR BLANK-FRAME DETECTION TESTS")
+    
+    tests.append(run_command(
+        'python -c "'
+        "from PIL import Image, ImageDraw; "
+        "from smart_evidence_renamer import SmartEvidenceRenamer as R; "
+        "page = Image.new('L', (1200, 1600), 255); "
+        "ImageDraw.Draw(page).text((40, 40), 'Paid 42.17 on 2024-03-02', fill=0); "
+        "assert not R._is_blank(page), 'sparse text page judged blank'; "
+        "assert R._is_blank(Image.new('L', (1200, 1600), 255)), 'solid frame not judged blank'"
+        '"',
+        "Smart Evidence Renamer - sparse text is OCR'd, solid frames are skipped",
+        30
+    ))
+    
+    # Test 8: Directory structure validation
     print("📁 DIRECTORY STRUCTURE VALIDATION")
     
     required_dirs = [
@@ -18,6 +18,8 @@ import logging
 from utils.path_utils import ensure_long_path
 import pickle
 import os
+import shutil
+import tempfile
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -31,10 +33,10 @@ class SmartBatchOCRLearner:
     
     def __init__(self, batch_size=50):
         self.batch_size = batch_size
-        self.learning_data = self.load_learning_data()
         self.current_batch = 0
         self.corrections_file = "output/ocr_corrections.json"
         self.learning_model_file = "output/ocr_learning_model.pkl"
+        self.learning_data = self.load_learning_data()
         
         # OCR configuration that we can adapt
         self.ocr_configs = [
@@ -45,13 +47,30 @@ class SmartBatchOCRLearner:
             r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,:;!?@()-',
         ]
         self.current_config_index = 0
+        # Images whose list-mode first pass reaches this confidence skip the full config sweep
+        self.list_mode_threshold = 75
+        # Folders need this many scored images before the sweep is narrowed to their best configs
+        self.min_folder_samples = 20
+        self.top_configs_per_folder = 2
         
     def load_learning_data(self):
         """Load previous corrections and learning patterns"""
         try:
             if os.path.exists(self.corrections_file):
                 with open(self.corrections_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    data = json.load(f)
+                # Older files tracked config performance globally ({config: [avg, ...]});
+                # it is now partitioned by source folder as running totals
+                # ({folder: {config: {"sum": ..., "count": ...}}})
+                performance = data.setdefault("config_performance", {})
+                if any(not isinstance(v, dict) for v in performance.values()):
+                    data["config_performance"] = performance = {}
+                # Per-image confidence lists from earlier runs collapse into totals
+                for folder_performance in performance.values():
+                    for config, stats in folder_performance.items():
+                        if isinstance(stats, list):
+                            folder_performance[config] = {"sum": sum(stats), "count": len(stats)}
+                return data
         except Exception as e:
             logger.warning(f"Could not load learning data: {e}")
         return {"corrections": {}, "patterns": {}, "config_performance": {}}
@@ -65,23 +84,37 @@ class SmartBatchOCRLearner:
         except Exception as e:
             logger.error(f"Could not save learning data: {e}")
     
+    @staticmethod
+    def _read_binary(image_path):
+        """Read an image and return (grayscale, adaptive-threshold binary) arrays"""
+        # Try OpenCV read first
+        img = cv2.imread(str(image_path))
+        if img is None:
+            # Fallback: try PIL with Windows long-path support
+            from PIL import Image as _PILImage
+            pil_img = _PILImage.open(ensure_long_path(image_path))
+            img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+        return gray, binary
+    
+    def preprocess_first_variant(self, image_path):
+        """Just variant 1 of preprocess_image_adaptive (grayscale + threshold), or None on failure"""
+        try:
+            return Image.fromarray(self._read_binary(image_path)[1])
+        except Exception as e:
+            logger.error(f"Error preprocessing {image_path}: {e}")
+            return None
+    
     def preprocess_image_adaptive(self, image_path):
         """Adaptive preprocessing based on learning"""
         try:
-            # Try OpenCV read first
-            img = cv2.imread(str(image_path))
-            if img is None:
-                # Fallback: try PIL with Windows long-path support
-                from PIL import Image as _PILImage
-                pil_img = _PILImage.open(ensure_long_path(image_path))
-                img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-                
             # Multiple preprocessing approaches
             processed_variants = []
             
             # Variant 1: Standard grayscale + threshold
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-            binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+            gray, binary = self._read_binary(image_path)
             processed_variants.append(Image.fromarray(binary))
             
             # Variant 2: Denoised + enhanced contrast
@@ -107,29 +140,92 @@ class SmartBatchOCRLearner:
             # Get detailed data with confidence scores
             data = pytesseract.image_to_data(image, config=config, output_type=pytesseract.Output.DICT)
             
-            # Filter by confidence and reconstruct text
+            # Filter by confidence and reconstruct text, keeping a running total
+            # instead of a parallel list of scores
             confident_words = []
-            confidence_scores = []
+            total_confidence = 0
             
-            for i in range(len(data['text'])):
-                conf = int(data['conf'][i])
-                text = data['text'][i].strip()
+            for text, conf in zip(data['text'], data['conf']):
+                conf = int(conf)
+                text = text.strip()
                 
                 if conf > 30 and text:  # Confidence threshold
                     confident_words.append(text)
-                    confidence_scores.append(conf)
+                    total_confidence += conf
             
-            if confident_words:
-                avg_confidence = sum(confidence_scores) / len(confidence_scores)
-                text = ' '.join(confident_words)
-                return text, avg_confidence
-            else:
+            if not confident_words:
                 return "", 0
+            return ' '.join(confident_words), total_confidence / len(confident_words)
                 
         except Exception as e:
             logger.error(f"OCR extraction failed: {e}")
             return "", 0
     
+    def _ocr_list_mode(self, images):
+        """Run the first OCR config over many images in a single Tesseract call.
+        
+        Tesseract accepts a text file listing image paths and loads the language
+        model once for the whole list, instead of once per image.
+        Returns a list of (text, confidence) tuples in the same order as images.
+        """
+        results = [("", 0)] * len(images)
+        if not images:
+            return results
+        
+        try:
+            with tempfile.TemporaryDirectory(prefix="ocr_list_") as tmp_dir:
+                image_files = []
+                for i, image in enumerate(images):
+                    image_file = os.path.join(tmp_dir, f"{i:05d}.png")
+                    image.save(image_file)
+                    image_files.append(image_file)
+                
+                list_file = os.path.join(tmp_dir, "list.txt")
+                with open(list_file, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(image_files) + '\n')
+                
+                data = pytesseract.image_to_data(list_file, config=self.ocr_configs[0],
+                                                 output_type=pytesseract.Output.DICT)
+            
+            # Each listed image comes back as its own page (page_num is 1-based)
+            page_words = [[] for _ in images]
+            page_totals = [0] * len(images)
+            for i in range(len(data['text'])):
+                page = int(data['page_num'][i]) - 1
+                conf = int(float(data['conf'][i]))
+                text = data['text'][i].strip()
+                
+                if 0 <= page < len(images) and conf > 30 and text:
+                    page_words[page].append(text)
+                    page_totals[page] += conf
+            
+            for page, words in enumerate(page_words):
+                if words:
+                    results[page] = (' '.join(words), page_totals[page] / len(words))
+                    
+        except Exception as e:
+            logger.error(f"List-mode OCR failed, falling back to per-image sweep: {e}")
+        
+        return results
+    
+    def configs_for_folder(self, folder):
+        """Pick the OCR configs to sweep for images from a source folder.
+        
+        Uses the folder's historical best configs once it has enough samples,
+        otherwise falls back to the full sweep (cold start).
+        """
+        performance = self.learning_data["config_performance"].get(folder, {})
+        samples = sum(stats["count"] for stats in performance.values())
+        if samples < self.min_folder_samples:
+            return self.ocr_configs
+        
+        ranked = sorted(
+            (config for config in performance if config in self.ocr_configs and performance[config]["count"]),
+            key=lambda config: performance[config]["sum"] / performance[config]["count"],
+            reverse=True
+        )
+        return ranked[:self.top_configs_per_folder] or self.ocr_configs
+    
     def detect_sender_recipient_smart(self, text, filename):
         """Smart sender/recipient detection with Craig's rules"""
         sender = "Craig"  # Default
@@ -174,27 +270,42 @@ class SmartBatchOCRLearner:
         batch_results = []
         batch_performance = {}
         
-        for img_path in tqdm(image_paths, desc=f"Batch {batch_num}"):
+        # Only the first variant of every image is prepared up front, so the batch
+        # can go through Tesseract in one list-mode call; the other variants are
+        # built per image, and only for images whose first pass was weak
+        prepared_paths = []
+        first_variants = []
+        for img_path in image_paths:
+            first_variant = self.preprocess_first_variant(img_path)
+            if first_variant is not None:
+                prepared_paths.append(img_path)
+                first_variants.append(first_variant)
+        
+        first_pass = self._ocr_list_mode(first_variants)
+        del first_variants  # list mode has already written them out
+        
+        for img_path, (first_text, first_confidence) in tqdm(
+                zip(prepared_paths, first_pass), total=len(prepared_paths), desc=f"Batch {batch_num}"):
             try:
-                # Get multiple processed variants
-                processed_images = self.preprocess_image_adaptive(img_path)
-                
-                if not processed_images:
-                    continue
-                
-                # Try different OCR configs and pick best result
-                best_text = ""
-                best_confidence = 0
-                best_config = self.ocr_configs[self.current_config_index]
+                # Seed with the list-mode result (config 1 on variant 1)
+                best_text = first_text
+                best_confidence = first_confidence
+                best_config = self.ocr_configs[0]
                 
-                for config in self.ocr_configs:
-                    for proc_img in processed_images:
-                        text, confidence = self.extract_text_with_confidence(proc_img, config)
-                        
-                        if confidence > best_confidence:
-                            best_text = text
-                            best_confidence = confidence
-                            best_config = config
+                # Only sweep configs/variants when the first pass was weak, and only
+                # the configs that have historically worked for this source folder
+                folder = img_path.parent.name
+                if best_confidence < self.list_mode_threshold:
+                    processed_images = self.preprocess_image_adaptive(img_path)
+                    for config in self.configs_for_folder(folder):
+                        for proc_img in processed_images:
+                            text, confidence = self.extract_text_with_confidence(proc_img, config)
+                            
+                            if confidence > best_confidence:
+                                best_text = text
+                                best_confidence = confidence
+                                best_config = config
+                    del processed_images  # release this image's variants before the next one
                 
                 # Detect sender/recipient
                 sender, recipient = self.detect_sender_recipient_smart(best_text, img_path.name)
@@ -217,20 +328,21 @@ class SmartBatchOCRLearner:
                 }
                 batch_results.append(result)
                 
-                # Track config performance
-                if best_config not in batch_performance:
-                    batch_performance[best_config] = []
-                batch_performance[best_config].append(best_confidence)
+                # Track config performance per source folder
+                folder_performance = batch_performance.setdefault(folder, {})
+                folder_performance.setdefault(best_config, []).append(best_confidence)
                 
             except Exception as e:
                 logger.error(f"Error processing {img_path}: {e}")
         
-        # Update learning data with batch performance
-        for config, confidences in batch_performance.items():
-            avg_conf = sum(confidences) / len(confidences) if confidences else 0
-            if config not in self.learning_data["config_performance"]:
-                self.learning_data["config_performance"][config] = []
-            self.learning_data["config_performance"][config].append(avg_conf)
+        # Update learning data with batch performance; only running totals are kept,
+        # so the learning file stays the same size however many images are processed
+        for folder, folder_performance in batch_performance.items():
+            learned = self.learning_data["config_performance"].setdefault(folder, {})
+            for config, confidences in folder_performance.items():
+                stats = learned.setdefault(config, {"sum": 0.0, "count": 0})
+                stats["sum"] += sum(confidences)
+                stats["count"] += len(confidences)
         
         return batch_results
     
@@ -316,20 +428,23 @@ def main():
         # Option to merge all batches
         merge = input("\nMerge all batches into single file? (y/n): ").lower()
         if merge == 'y':
-            # Merge all batch CSVs
-            all_dfs = []
-            for file in batch_files:
-                try:
-                    df = pd.read_csv(file, encoding='utf-8')
-                    all_dfs.append(df)
-                except Exception as e:
-                    logger.error(f"Error reading {file}: {e}")
+            # Merge all batch CSVs. Every batch shares the same columns, so the merge is
+            # a plain file concatenation that keeps only the first header
+            merged_file = f"output/merged_smart_ocr_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            header_written = False
+            with open(merged_file, 'wb') as out:
+                for file in batch_files:
+                    try:
+                        with open(file, 'rb') as src:
+                            header = src.readline()
+                            if not header_written:
+                                out.write(header)
+                                header_written = True
+                            shutil.copyfileobj(src, out, length=1 << 20)
+                    except Exception as e:
+                        logger.error(f"Error reading {file}: {e}")
             
-            if all_dfs:
-                merged_df = pd.concat(all_dfs, ignore_index=True)
-                merged_file = f"output/merged_smart_ocr_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                merged_df.to_csv(merged_file, index=False, encoding='utf-8')
-                logger.info(f"Merged results saved to: {merged_file}")
+            logger.info(f"Merged results saved to: {merged_file}")
 
 
 if __name__ == "__main__":
@@ -4,17 +4,200 @@ Smart Evidence Renamer for Harper's Custody Case
 Intelligently renames files based on OCR content, people involved, and context
 """
 
+import atexit
+import csv
+import hashlib
 import os
 import re
 import shutil
+import sqlite3
+import struct
+import sys
+import tempfile
 from pathlib import Path
+from collections import Counter
 from datetime import datetime
 import pytesseract
-from PIL import Image
-import pandas as pd
+from PIL import Image, ImageStat
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, repeat
 from utils.path_utils import safe_filename, ensure_long_path
 
+try:
+    import tesserocr
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    from pillow_heif import register_heif_opener
+    register_heif_opener()  # adds the HEIF decoder to Pillow
+    HAS_HEIF = True
+except ImportError:
+    HAS_HEIF = False
+
+# A whole 10-digit number, optionally after a leading 1 country code (+1506...);
+# the captured group is the 10-digit number findall returns
+PHONE_PATTERN = re.compile(r'(?<!\d)1?(\d{10})(?!\d)')
+
+MONTH_MAP = {
+    'january': '01', 'jan': '01', 'february': '02', 'feb': '02',
+    'march': '03', 'mar': '03', 'april': '04', 'apr': '04',
+    'may': '05', 'june': '06', 'jun': '06', 'july': '07', 'jul': '07',
+    'august': '08', 'aug': '08', 'september': '09', 'sep': '09',
+    'october': '10', 'oct': '10', 'november': '11', 'nov': '11',
+    'december': '12', 'dec': '12'
+}
+
+# All text date formats in one alternation; group names are prefixed with the format
+# so the matching branch can be read back from match.lastgroup
+DATE_IN_TEXT_PATTERN = re.compile(
+    r'\b(?P<mdy_m>\d{1,2})[/-](?P<mdy_d>\d{1,2})[/-](?P<mdy_y>\d{4})\b'        # MM/DD/YYYY or MM-DD-YYYY
+    r'|\b(?P<ymd_y>\d{4})[/-](?P<ymd_m>\d{1,2})[/-](?P<ymd_d>\d{1,2})\b'      # YYYY/MM/DD or YYYY-MM-DD
+    r'|\b(?P<mdyy_m>\d{1,2})[/-](?P<mdyy_d>\d{1,2})[/-](?P<mdyy_y>\d{2})\b'   # MM/DD/YY or MM-DD-YY
+    r'|(?P<name_m>January|February|March|April|May|June|July|August|September|October|November|December'
+    r'|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(?P<name_d>\d{1,2}),?\s+(?P<name_y>\d{4})',
+    re.IGNORECASE
+)
+
+DATE_IN_FILENAME_PATTERN = re.compile(
+    r'(?P<ymd_y>\d{4})[-_]?(?P<ymd_m>\d{2})[-_]?(?P<ymd_d>\d{2})'    # YYYY-MM-DD or YYYYMMDD
+    r'|(?P<mdy_m>\d{2})[-_]?(?P<mdy_d>\d{2})[-_]?(?P<mdy_y>\d{4})'   # MM-DD-YYYY or MMDDYYYY
+)
+
+TESSERACT_WINDOWS_PATH = "C:/Program Files/Tesseract-OCR/tesseract.exe"
+# Skip Tesseract's inverted-text probe; screenshots are dark text on light backgrounds
+TESSERACT_CONFIG = '--psm 6 -c tessedit_do_invert=0'
+# Longest image side handed to Tesseract; LSTM time scales with pixel count
+OCR_MAX_SIDE = 1600
+# Grayscale standard deviation (grey levels) below which an image is a solid frame.
+# Even a single short line of text on white sits well above this; only flat fills
+# and their compression noise fall under it
+BLANK_IMAGE_STDDEV = 1.0
+# Decoders Image.open may try, instead of probing every registered plugin
+OCR_IMAGE_FORMATS = ('PNG', 'JPEG', 'GIF', 'BMP', 'TIFF', 'WEBP') + (('HEIF',) if HAS_HEIF else ())
+# Images per Tesseract list-file run when OCR goes through pytesseract
+OCR_BATCH_SIZE = 50
+# OCR text cache kept in the output folder so reruns skip unchanged images; named apart
+# from smart_ocr_processor's output/.ocr_cache.db, whose ocr table has a different schema
+OCR_CACHE_FILENAME = '.renamer_ocr_cache.db'
+# Bytes of each image hashed into its cache key (with size and mtime)
+OCR_CACHE_HASH_BYTES = 64 * 1024
+
+RENAMING_REPORT_FIELDS = [
+    'original_name', 'new_name', 'category', 'people', 'date_found', 'subfolder', 'text_sample'
+]
+# Write buffer for the CSV/TXT reports (the 8 KB default flushes far too often)
+REPORT_BUFFER_SIZE = 1 << 20
+
+# Linux ioctl for copy-on-write file clones (btrfs, XFS)
+FICLONE = 0x40049409
+# Larger than the 8 KB default so full copies move in big chunks
+COPY_BUFFER_SIZE = 1 << 20
+# Numbered variants tried before giving up on a colliding filename
+MAX_DUPLICATE_NAMES = 10000
+
+# HEIC photos are always collected and copied; they are only OCR'd when pillow-heif can decode them
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.heic'}
+
+# Per-process renamer used by the OCR worker pool
+_worker_renamer = None
+
+
+def _configure_tesseract():
+    """Point pytesseract at the Windows install if present"""
+    if os.path.exists(TESSERACT_WINDOWS_PATH):
+        pytesseract.pytesseract.tesseract_cmd = TESSERACT_WINDOWS_PATH
+
+
+def _iter_image_files(root):
+    """Walk a folder tree once, yielding image files by case-insensitive extension"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_image_files(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                yield Path(entry.path)
+
+
+def _clone_or_copy(src, dst):
+    """Place src at dst without duplicating its bytes when the filesystem allows.
+    
+    Tries a hardlink (same volume), then a reflink on Linux, then a full copy.
+    dst is created exclusively: FileExistsError is raised if it already exists.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+    
+    # O_EXCL claims the name atomically, so concurrent workers can never pick the same file
+    fd = os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0), 0o644)
+    with os.fdopen(fd, 'wb') as dst_file, open(src, 'rb', buffering=COPY_BUFFER_SIZE) as src_file:
+        cloned = False
+        if sys.platform.startswith('linux'):
+            import fcntl
+            try:
+                fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+                cloned = True
+            except OSError:
+                pass
+        if not cloned:
+            shutil.copyfileobj(src_file, dst_file, length=COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+
+
+def _place_unique(src, dest_folder, filename):
+    """Clone/copy src into dest_folder under filename, adding -001, -002... on collisions.
+    
+    Returns the destination path actually used.
+    """
+    stem, suffix = os.path.splitext(filename)
+    for counter in range(MAX_DUPLICATE_NAMES):
+        name = filename if counter == 0 else f"{stem}-{counter:03d}{suffix}"
+        dest_path = dest_folder / name
+        try:
+            _clone_or_copy(src, ensure_long_path(dest_path))
+            return dest_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No free name for {filename} in {dest_folder}")
+
+
+def _init_worker(ocr_cache_path=None):
+    """Set up an OCR worker process"""
+    global _worker_renamer
+    # One Tesseract thread per process scales better than OpenMP across many images
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+    _worker_renamer = SmartEvidenceRenamer()
+    if ocr_cache_path:
+        _worker_renamer.open_ocr_cache(ocr_cache_path)
+
+
+def _process_batch_in_worker(file_paths, output_path):
+    """Pool entry point: process a batch of files with this worker's renamer"""
+    return _worker_renamer.process_batch(file_paths, output_path)
+
+
 class SmartEvidenceRenamer:
+    # Short names used in generated filenames
+    _DISPLAY_NAMES = {
+        'emma_ryan': 'emma',
+        'matt_ryan': 'matt',
+        'cole_brook': 'cole',
+        'tony_baker': 'tony',
+        'harper': 'harper'
+    }
+
     def __init__(self):
         self.case_number = "FDSJ-739-24"
         self.processed_count = 0
@@ -84,123 +267,333 @@ class SmartEvidenceRenamer:
                 'parenting plan', 'court order'
             ]
         }
+        
+        _configure_tesseract()
+        
+        # Persistent libtesseract handle, created on first OCR call
+        self._api = None
+        
+        # Optional OCR text cache, see open_ocr_cache()
+        self._ocr_cache = None
+        
+        # Single automaton over every name and keyword so analysis is one pass over the text
+        self._automaton = self._build_keyword_automaton() if HAS_AHOCORASICK else None
+        self._phone_to_person = {
+            info['phone']: person_id
+            for person_id, info in self.people_database.items() if info['phone']
+        }
+        
+        # Case-insensitive alternations used when pyahocorasick is unavailable; the regex
+        # engine scans the original text without allocating a lowercased copy
+        self._name_patterns = {
+            person_id: self._compile_keywords(person_info['names'])
+            for person_id, person_info in self.people_database.items()
+        }
+        self._category_patterns = {
+            category: self._compile_keywords(keywords)
+            for category, keywords in self.content_categories.items()
+        }
+
+    @staticmethod
+    def _compile_keywords(keywords):
+        """Compile keywords into one case-insensitive substring alternation"""
+        return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton emitting ('person', id) / ('cat', category) hits"""
+        payloads = {}
+        for person_id, person_info in self.people_database.items():
+            for name in person_info['names']:
+                payloads.setdefault(name.lower(), []).append(('person', person_id))
+        for category, keywords in self.content_categories.items():
+            for keyword in keywords:
+                payloads.setdefault(keyword.lower(), []).append(('cat', category))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, hits in payloads.items():
+            automaton.add_word(keyword, tuple(hits))
+        automaton.make_automaton()
+        return automaton
+
+    def open_ocr_cache(self, cache_path):
+        """Open (or create) the SQLite cache mapping image content keys to OCR text"""
+        self._ocr_cache = sqlite3.connect(str(cache_path), timeout=30)
+        # WAL lets every pool worker read and write the cache concurrently
+        self._ocr_cache.execute('PRAGMA journal_mode=WAL')
+        self._ocr_cache.execute('CREATE TABLE IF NOT EXISTS ocr (key BLOB PRIMARY KEY, text TEXT)')
+        self._ocr_cache.commit()
+        atexit.register(self._ocr_cache.close)
+
+    @staticmethod
+    def _ocr_cache_key(image_path):
+        """Key an image by size, mtime and a hash of its first bytes"""
+        stat = os.stat(image_path)
+        with open(image_path, 'rb') as f:
+            digest = hashlib.blake2b(f.read(OCR_CACHE_HASH_BYTES), digest_size=16).digest()
+        return struct.pack('<QQ', stat.st_size, stat.st_mtime_ns) + digest
+
+    def extract_text_cached(self, image_paths):
+        """Like extract_text_batch, but reuse cached text for images seen on earlier runs"""
+        if self._ocr_cache is None:
+            return self.extract_text_batch(image_paths)
+        
+        keys = []
+        texts = []
+        for image_path in image_paths:
+            try:
+                key = self._ocr_cache_key(image_path)
+                row = self._ocr_cache.execute('SELECT text FROM ocr WHERE key = ?', (key,)).fetchone()
+            except (OSError, sqlite3.Error):
+                key, row = None, None
+            keys.append(key)
+            texts.append(row[0] if row else None)
+        
+        misses = [i for i, text in enumerate(texts) if text is None]
+        if misses:
+            fresh_texts = self.extract_text_batch([image_paths[i] for i in misses])
+            for i, text in zip(misses, fresh_texts):
+                texts[i] = text
+            # Empty results may be transient OCR failures, so only cache real text
+            fresh_rows = [(keys[i], texts[i]) for i in misses if texts[i] and keys[i] is not None]
+            try:
+                with self._ocr_cache:
+                    self._ocr_cache.executemany('INSERT OR REPLACE INTO ocr (key, text) VALUES (?, ?)',
+                                                fresh_rows)
+            except sqlite3.Error:
+                # A locked or broken cache only costs a re-OCR on the next run
+                pass
+        
+        return texts
+
+    def _get_tesseract_api(self):
+        """Return a reusable tesserocr API so the model is loaded once per process"""
+        if self._api is None:
+            self._api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK)
+            self._api.SetVariable('tessedit_do_invert', '0')
+            atexit.register(self._api.End)
+        return self._api
+
+    @staticmethod
+    def _is_blank(image):
+        """True for solid frames: the grayscale values barely vary across the image"""
+        if not image.width or not image.height:
+            return True
+        return ImageStat.Stat(image).stddev[0] < BLANK_IMAGE_STDDEV
+
+    def _prepare_image(self, image_path):
+        """Load an image and shrink it to what Tesseract needs.
+        
+        Returns None for blank/solid frames, which have no text worth OCR'ing, and for
+        HEIC photos without pillow-heif, which are still renamed but get no text.
+        """
+        if not HAS_HEIF and Path(image_path).suffix.lower() == '.heic':
+            return None
+        with Image.open(image_path, formats=OCR_IMAGE_FORMATS) as image:
+            # Let JPEG decode straight to grayscale at reduced scale
+            image.draft('L', (OCR_MAX_SIDE, OCR_MAX_SIDE))
+            # Grayscale is enough for the LSTM engine and a third of the RGB bytes.
+            # Images already in 'L' are decoded as-is rather than copied; either way
+            # the pixel data outlives the file handle, which is closed here
+            if image.mode != 'L':
+                image = image.convert('L')
+            else:
+                image.load()
+        
+        # Downscale large screenshots; text stays legible well below full resolution
+        scale = min(1.0, OCR_MAX_SIDE / max(image.size))
+        if scale < 1.0:
+            width, height = image.size
+            image = image.resize((int(width * scale), int(height * scale)), Image.LANCZOS)
+        
+        if self._is_blank(image):
+            return None
+        return image
+
+    def _ocr_image(self, image):
+        """Run Tesseract on an image already passed through _prepare_image"""
+        # In-process via tesserocr when available, otherwise one tesseract
+        # subprocess per image through pytesseract
+        if HAS_TESSEROCR:
+            api = self._get_tesseract_api()
+            api.SetImage(image)
+            text = api.GetUTF8Text()
+        else:
+            text = pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
+        return text.strip()
 
     def extract_text_from_image(self, image_path):
         """Extract text from image using OCR"""
         try:
-            # Configure tesseract if needed
-            if os.path.exists("C:/Program Files/Tesseract-OCR/tesseract.exe"):
-                pytesseract.pytesseract.tesseract_cmd = r'C:/Program Files/Tesseract-OCR/tesseract.exe'
-            
             # Open and process image
-            image = Image.open(image_path)
-            
-            # Convert to RGB if needed
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            image = self._prepare_image(image_path)
+            if image is None:
+                return ""
             
             # Extract text
-            text = pytesseract.image_to_string(image, config='--psm 6')
-            return text.strip()
+            return self._ocr_image(image)
         
         except Exception as e:
             print(f"  ⚠️ OCR failed for {image_path.name}: {e}")
             return ""
 
+    def _extract_text_pipelined(self, image_paths):
+        """OCR images one at a time while a helper thread loads the next one.
+        
+        Reading and decoding the next file (Pillow releases the GIL) overlaps with
+        Tesseract recognising the current image.
+        """
+        texts = []
+        if not image_paths:
+            return texts
+        
+        with ThreadPoolExecutor(max_workers=1) as loader:
+            next_image = loader.submit(self._prepare_image, image_paths[0])
+            for i, image_path in enumerate(image_paths):
+                current_image = next_image
+                if i + 1 < len(image_paths):
+                    next_image = loader.submit(self._prepare_image, image_paths[i + 1])
+                
+                try:
+                    image = current_image.result()
+                    texts.append(self._ocr_image(image) if image is not None else "")
+                except Exception as e:
+                    print(f"  ⚠️ OCR failed for {image_path.name}: {e}")
+                    texts.append("")
+        
+        return texts
+
+    def extract_text_batch(self, image_paths):
+        """Extract text from several images, returning one string per path in order.
+        
+        Through pytesseract the images are listed in a text file and OCR'd by a single
+        Tesseract run, so the model is loaded once per batch instead of once per image.
+        With tesserocr the model is already resident and images go through one by one,
+        with the next image loaded in the background.
+        """
+        if HAS_TESSEROCR or len(image_paths) < 2:
+            return self._extract_text_pipelined(image_paths)
+        
+        texts = [""] * len(image_paths)
+        try:
+            with tempfile.TemporaryDirectory(prefix='ocr_batch_') as tmp_dir:
+                # Blank frames keep their empty text and never reach Tesseract
+                prepared_files = []
+                ocr_indices = []
+                for i, image_path in enumerate(image_paths):
+                    image = self._prepare_image(image_path)
+                    if image is None:
+                        continue
+                    prepared_file = os.path.join(tmp_dir, f'{len(prepared_files):05d}.png')
+                    image.save(prepared_file)
+                    prepared_files.append(prepared_file)
+                    ocr_indices.append(i)
+                
+                if not prepared_files:
+                    return texts
+                
+                list_file = os.path.join(tmp_dir, 'list.txt')
+                with open(list_file, 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(prepared_files) + '\n')
+                
+                output = pytesseract.image_to_string(list_file, config=TESSERACT_CONFIG)
+            
+            # Tesseract ends every page with a form feed
+            pages = output.split('\f')
+            if len(pages) == len(prepared_files) + 1 and not pages[-1].strip():
+                pages.pop()
+            if len(pages) == len(prepared_files):
+                for i, page in zip(ocr_indices, pages):
+                    texts[i] = page.strip()
+                return texts
+            print(f"  ⚠️ Batch OCR returned {len(pages)} pages for {len(prepared_files)} images")
+        
+        except Exception as e:
+            print(f"  ⚠️ Batch OCR failed: {e}")
+        
+        # Fall back to one OCR call per image
+        return self._extract_text_pipelined(image_paths)
+
+    def analyze(self, text):
+        """Identify people and the content category in a single scan of the text.
+        
+        Returns (identified_people, category) with the same results as
+        identify_people_in_text and categorize_content.
+        """
+        if self._automaton is None:
+            return self.identify_people_in_text(text), self.categorize_content(text)
+        
+        people_found = set()
+        categories_found = set()
+        for _, hits in self._automaton.iter(text.lower()):
+            for kind, value in hits:
+                if kind == 'person':
+                    people_found.add(value)
+                else:
+                    categories_found.add(value)
+        
+        for phone in PHONE_PATTERN.findall(text):
+            if phone in self._phone_to_person:
+                people_found.add(self._phone_to_person[phone])
+        
+        # Keep database/category declaration order so results match the per-keyword scan
+        identified_people = [p for p in self.people_database if p in people_found]
+        category = next((c for c in self.content_categories if c in categories_found), 'general')
+        return identified_people, category
+
     def identify_people_in_text(self, text):
         """Identify people mentioned in the text"""
-        text_lower = text.lower()
-        identified_people = []
+        # A known phone number identifies its owner outright, so only people
+        # not already matched that way need their names scanned
+        phone_matches = {
+            self._phone_to_person[phone] for phone in PHONE_PATTERN.findall(text)
+            if phone in self._phone_to_person
+        }
         
-        for person_id, person_info in self.people_database.items():
-            # Check names
-            for name in person_info['names']:
-                if name.lower() in text_lower:
-                    identified_people.append(person_id)
-                    break
-            
-            # Check phone number
-            if person_info['phone'] and person_info['phone'] in text:
-                if person_id not in identified_people:
-                    identified_people.append(person_id)
+        identified_people = []
+        for person_id in self.people_database:
+            if person_id in phone_matches or self._name_patterns[person_id].search(text):
+                identified_people.append(person_id)
         
         return identified_people
 
     def categorize_content(self, text):
         """Categorize content based on keywords"""
-        text_lower = text.lower()
-        
-        for category, keywords in self.content_categories.items():
-            if any(keyword in text_lower for keyword in keywords):
+        for category, pattern in self._category_patterns.items():
+            if pattern.search(text):
                 return category
         
         return 'general'
 
     def extract_date_from_text(self, text):
         """Extract date from text content"""
-        # Look for various date formats
-        date_patterns = [
-            r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{4})\b',  # MM/DD/YYYY or MM-DD-YYYY
-            r'\b(\d{4})[/-](\d{1,2})[/-](\d{1,2})\b',  # YYYY/MM/DD or YYYY-MM-DD
-            r'\b(\d{1,2})[/-](\d{1,2})[/-](\d{2})\b',  # MM/DD/YY or MM-DD-YY
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})'
-        ]
+        # Look for various date formats in a single pass
+        match = DATE_IN_TEXT_PATTERN.search(text)
+        if not match:
+            return None
+        
+        fmt = match.lastgroup.split('_')[0]
+        year = match.group(f'{fmt}_y')
+        day = match.group(f'{fmt}_d')
+        if fmt == 'name':  # Month name format
+            month = MONTH_MAP.get(match.group('name_m').lower(), '00')
+        else:
+            month = match.group(f'{fmt}_m')
         
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    # Try to parse and format the date
-                    if len(match.groups()) == 3:
-                        if match.group(1).isdigit() and len(match.group(1)) == 4:  # YYYY format
-                            year, month, day = match.groups()
-                        elif match.group(1).isalpha():  # Month name format
-                            month_name = match.group(1)
-                            day = match.group(2)
-                            year = match.group(3)
-                            # Convert month name to number
-                            month_map = {
-                                'january': '01', 'jan': '01', 'february': '02', 'feb': '02',
-                                'march': '03', 'mar': '03', 'april': '04', 'apr': '04',
-                                'may': '05', 'june': '06', 'jun': '06', 'july': '07', 'jul': '07',
-                                'august': '08', 'aug': '08', 'september': '09', 'sep': '09',
-                                'october': '10', 'oct': '10', 'november': '11', 'nov': '11',
-                                'december': '12', 'dec': '12'
-                            }
-                            month = month_map.get(month_name.lower(), '00')
-                        else:  # MM/DD/YYYY format
-                            month, day, year = match.groups()
-                        
-                        # Ensure 4-digit year
-                        if len(year) == 2:
-                            year = '20' + year
-                        
-                        return f"{year}{month.zfill(2)}{day.zfill(2)}"
-                except:
-                    continue
+        # Ensure 4-digit year
+        if len(year) == 2:
+            year = '20' + year
         
-        return None
+        return f"{year}{month.zfill(2)}{day.zfill(2)}"
 
     def extract_date_from_filename(self, filename):
         """Extract date from filename"""
-        # Look for date patterns in filename
-        date_patterns = [
-            r'(\d{4})[-_]?(\d{2})[-_]?(\d{2})',  # YYYY-MM-DD or YYYYMMDD
-            r'(\d{2})[-_]?(\d{2})[-_]?(\d{4})',  # MM-DD-YYYY or MMDDYYYY
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, filename)
-            if match:
-                if len(match.group(1)) == 4:  # First group is year
-                    year, month, day = match.groups()
-                else:  # First group is month
-                    month, day, year = match.groups()
-                
-                return f"{year}{month.zfill(2)}{day.zfill(2)}"
+        match = DATE_IN_FILENAME_PATTERN.search(filename)
+        if not match:
+            return None
         
-        return None
+        fmt = match.lastgroup.split('_')[0]
+        year, month, day = match.group(f'{fmt}_y', f'{fmt}_m', f'{fmt}_d')
+        return f"{year}{month.zfill(2)}{day.zfill(2)}"
 
     def generate_smart_filename(self, original_path, text_content, identified_people, category, date_str):
         """Generate intelligent filename based on analysis"""
@@ -211,21 +604,13 @@ class SmartEvidenceRenamer:
         # Add people involved
         if identified_people:
             # Sort people for consistent naming
-            people_names = []
-            for person in identified_people:
-                if person == 'emma_ryan':
-                    people_names.append('emma')
-                elif person == 'matt_ryan':
-                    people_names.append('matt')
-                elif person == 'cole_brook':
-                    people_names.append('cole')
-                elif person == 'tony_baker':
-                    people_names.append('tony')
-                elif person == 'harper':
-                    people_names.append('harper')
+            people_names = sorted(
+                self._DISPLAY_NAMES[person] for person in identified_people
+                if person in self._DISPLAY_NAMES
+            )
             
             if people_names:
-                components.append('-'.join(sorted(people_names)))
+                components.append('-'.join(people_names))
         
         # Add category
         if category != 'general':
@@ -249,6 +634,65 @@ class SmartEvidenceRenamer:
         candidate = f"{base_name}{original_ext}"
         return safe_filename(candidate, max_len=140)
 
+    def process_batch(self, file_paths, output_path):
+        """OCR a batch of files together, then analyze and copy each one"""
+        texts = self.extract_text_cached(file_paths)
+        return [
+            self.process_one(file_path, output_path, text_content)
+            for file_path, text_content in zip(file_paths, texts)
+        ]
+
+    def process_one(self, file_path, output_path, text_content=None):
+        """OCR, analyze, and copy a single file into the renamed output tree.
+        
+        Pass text_content to skip OCR when the text was already extracted.
+        Returns the renaming log row, or None if the file could not be processed.
+        """
+        try:
+            # Extract text from image
+            if text_content is None:
+                text_content = self.extract_text_from_image(file_path)
+            
+            # Analyze content
+            identified_people, category = self.analyze(text_content)
+            
+            # Extract date
+            date_str = self.extract_date_from_text(text_content)
+            if not date_str:
+                date_str = self.extract_date_from_filename(file_path.name)
+            
+            # Generate smart filename
+            new_filename = self.generate_smart_filename(
+                file_path, text_content, identified_people, category, date_str
+            )
+            
+            # Determine output subfolder
+            if identified_people:
+                if len(identified_people) > 1:
+                    subfolder = 'conversations'
+                else:
+                    subfolder = category
+            else:
+                subfolder = category
+            
+            # Link/clone (or copy) file under a unique name, with Windows long-path support
+            dest_path = _place_unique(ensure_long_path(file_path), output_path / subfolder, new_filename)
+            
+            # Log the renaming
+            return {
+                'original_name': file_path.name,
+                'new_name': dest_path.name,
+                'category': category,
+                'people': ', '.join(identified_people) if identified_people else 'None',
+                'date_found': date_str or 'None',
+                'subfolder': subfolder,
+                'text_sample': text_content[:100].replace('\n', ' ') if text_content else 'No text extracted'
+            }
+            
+        except Exception as e:
+            print(f"  ❌ Error processing {file_path.name}: {e}")
+            return None
+
     def process_evidence_folder(self, source_folder, output_folder):
         """Process all files in evidence folder with smart renaming"""
         
@@ -267,90 +711,53 @@ class SmartEvidenceRenamer:
         for category in categories:
             (output_path / category).mkdir(exist_ok=True)
         
-        # Process all image files
-        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.heic'}
-        files_to_process = []
-        
-        for ext in image_extensions:
-            files_to_process.extend(source_path.rglob(f'*{ext}'))
-            files_to_process.extend(source_path.rglob(f'*{ext.upper()}'))
+        # Process all image files (single directory walk, any extension case)
+        files_to_process = list(_iter_image_files(source_path))
         
         print(f"\n🔍 Found {len(files_to_process)} image files to process...")
         print(f"📂 Output folder: {output_folder}")
         print("=" * 60)
         
-        # Track renaming for report
-        renaming_log = []
-        
-        for file_path in files_to_process:
-            try:
+        # Stream renaming rows straight to the CSV report and keep only the
+        # summary counts in memory
+        report_path = output_path / f"SMART_RENAMING_REPORT_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        category_counts = Counter()
+        people_counts = Counter()
+        
+        # OCR is CPU-bound, so fan batches out across one worker process per core;
+        # each worker OCRs its batch in a single Tesseract run
+        workers = os.cpu_count() or 1
+        batch_size = max(1, min(OCR_BATCH_SIZE, -(-len(files_to_process) // workers)))
+        batches = [files_to_process[i:i + batch_size]
+                   for i in range(0, len(files_to_process), batch_size)]
+        
+        with open(report_path, 'w', newline='', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as report_file, \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                    initargs=(output_path / OCR_CACHE_FILENAME,)) as executor:
+            writer = csv.DictWriter(report_file, fieldnames=RENAMING_REPORT_FIELDS)
+            writer.writeheader()
+            
+            results = executor.map(_process_batch_in_worker, batches, repeat(output_path))
+            for file_path, log_row in zip(files_to_process, chain.from_iterable(results)):
                 self.processed_count += 1
-                print(f"\n[{self.processed_count}/{len(files_to_process)}] Processing: {file_path.name}")
+                print(f"\n[{self.processed_count}/{len(files_to_process)}] Processed: {file_path.name}")
                 
-                # Extract text from image
-                text_content = self.extract_text_from_image(file_path)
-                
-                # Analyze content
-                identified_people = self.identify_people_in_text(text_content)
-                category = self.categorize_content(text_content)
-                
-                # Extract date
-                date_str = self.extract_date_from_text(text_content)
-                if not date_str:
-                    date_str = self.extract_date_from_filename(file_path.name)
-                
-                # Generate smart filename
-                new_filename = self.generate_smart_filename(
-                    file_path, text_content, identified_people, category, date_str
-                )
-                
-                # Determine output subfolder
-                if identified_people:
-                    if len(identified_people) > 1:
-                        subfolder = 'conversations'
-                    else:
-                        subfolder = category
-                else:
-                    subfolder = category
-                
-                # Create destination path
-                dest_folder = output_path / subfolder
-                dest_path = dest_folder / new_filename
-                
-                # Handle duplicate filenames
-                counter = 1
-                original_dest = dest_path
-                while dest_path.exists():
-                    stem = original_dest.stem
-                    suffix = original_dest.suffix
-                    dest_path = original_dest.parent / f"{stem}-{counter:03d}{suffix}"
-                    counter += 1
+                if log_row is None:
+                    continue
                 
-                # Copy file with Windows long-path support
-                shutil.copy2(ensure_long_path(file_path), ensure_long_path(dest_path))
                 self.renamed_count += 1
+                writer.writerow(log_row)
+                category_counts[log_row['category']] += 1
+                if log_row['people'] != 'None':
+                    people_counts.update(log_row['people'].split(', '))
                 
-                # Log the renaming
-                renaming_log.append({
-                    'original_name': file_path.name,
-                    'new_name': dest_path.name,
-                    'category': category,
-                    'people': ', '.join(identified_people) if identified_people else 'None',
-                    'date_found': date_str or 'None',
-                    'subfolder': subfolder,
-                    'text_sample': text_content[:100].replace('\n', ' ') if text_content else 'No text extracted'
-                })
-                
-                print(f"  👥 People: {', '.join(identified_people) if identified_people else 'None'}")
-                print(f"  📂 Category: {category}")
-                print(f"  📅 Date: {date_str or 'Not found'}")
-                print(f"  ✅ Renamed: {dest_path.name}")
-                
-            except Exception as e:
-                print(f"  ❌ Error processing {file_path.name}: {e}")
+                print(f"  👥 People: {log_row['people']}")
+                print(f"  📂 Category: {log_row['category']}")
+                print(f"  📅 Date: {log_row['date_found'] if log_row['date_found'] != 'None' else 'Not found'}")
+                print(f"  ✅ Renamed: {log_row['new_name']}")
         
         # Generate report
-        self.generate_renaming_report(output_path, renaming_log)
+        self.generate_renaming_report(output_path, report_path, category_counts, people_counts)
         
         print("\n" + "=" * 60)
         print(f"🎉 SMART RENAMING COMPLETE!")
@@ -359,19 +766,12 @@ class SmartEvidenceRenamer:
         print(f"📁 Output location: {output_folder}")
         print("=" * 60)
 
-    def generate_renaming_report(self, output_path, renaming_log):
-        """Generate detailed renaming report"""
-        
-        # Create DataFrame
-        df = pd.DataFrame(renaming_log)
-        
-        # Save CSV report
-        report_path = output_path / f"SMART_RENAMING_REPORT_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(report_path, index=False)
+    def generate_renaming_report(self, output_path, report_path, category_counts, people_counts):
+        """Generate summary report alongside the streamed CSV report"""
         
         # Create summary report
         summary_path = output_path / "RENAMING_SUMMARY.txt"
-        with open(summary_path, 'w', encoding='utf-8') as f:
+        with open(summary_path, 'w', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
             f.write(f"HARPER'S EVIDENCE SMART RENAMING REPORT\n")
             f.write(f"Case: {self.case_number}\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -384,21 +784,14 @@ class SmartEvidenceRenamer:
             
             # Category breakdown
             f.write("CATEGORY BREAKDOWN:\n")
-            category_counts = df['category'].value_counts()
-            for category, count in category_counts.items():
+            for category, count in category_counts.most_common():
                 f.write(f"  {category}: {count} files\n")
             f.write("\n")
             
             # People involved breakdown
             f.write("PEOPLE IDENTIFIED:\n")
-            all_people = []
-            for people_list in df['people']:
-                if people_list != 'None':
-                    all_people.extend([p.strip() for p in people_list.split(',')])
-            
-            if all_people:
-                people_counts = pd.Series(all_people).value_counts()
-                for person, count in people_counts.items():
+            if people_counts:
+                for person, count in people_counts.most_common():
                     f.write(f"  {person}: {count} files\n")
             else:
                 f.write("  No people identified in processed files\n")
@@ -12,61 +12,74 @@ import json
 import re
 from datetime import datetime
 
+from parquet_mirror import HAS_PYARROW, PARQUET_ERRORS, write_parquet
+
 class SmartOCRReprocessor:
     """Reprocesses problematic OCR results with enhanced settings"""
     
     def __init__(self):
         self.processor = EnhancedOCRProcessor()
         self.quality_threshold = 65  # Confidence threshold for reprocessing
+        self._repeat_re = re.compile(r'(.)\1{4,}')  # Garbled text: 5+ repeated characters
+        self._word_pattern = r'\S+'
+        self._short_word_pattern = r'(?<!\S)[^\W\d_]{1,2}(?!\S)'  # Whole 1-2 letter words
         
     def identify_problem_files(self, csv_file):
         """Identify files that need reprocessing"""
         print(f"🔍 Identifying problem files in {csv_file}")
         
-        df = pd.read_csv(csv_file, encoding='utf-8')
-        problem_files = []
+        if Path(csv_file).suffix.lower() == '.parquet':
+            df = pd.read_parquet(csv_file)
+        else:
+            df = pd.read_csv(csv_file, encoding='utf-8')
+        
+        def column(name, default):
+            return df[name] if name in df.columns else pd.Series(default, index=df.index)
+        
+        filenames = column('filename', '')
+        filepaths = column('filepath', '').fillna('').astype(str)
+        texts = column('raw_text', '').astype(str)
+        confidences = column('confidence', 100)  # Default high if no confidence
+        
+        # Each check runs column-wise over the whole CSV
+        # Low confidence
+        low_conf = confidences < self.quality_threshold
+        # Very short text
+        short_text = texts.str.strip().str.len() < 10
+        # Garbled text indicators: repeated characters
+        repeated = texts.map(self._repeat_re.search).notna()
+        # Too many single/double character words (garbled): >30% very short words
+        word_counts = texts.str.count(self._word_pattern)
+        short_word_counts = texts.str.count(self._short_word_pattern)
+        many_short = (word_counts > 5) & (short_word_counts > word_counts * 0.3)
+        
+        needs_reprocess = (low_conf | short_text | repeated | many_short) & (filepaths != '')
         
-        for idx, row in df.iterrows():
-            filename = row.get('filename', '')
-            filepath = row.get('filepath', '')
-            text = str(row.get('raw_text', ''))
-            confidence = row.get('confidence', 100)  # Default high if no confidence
+        problem_files = []
+        for idx in df.index[needs_reprocess.to_numpy()]:
+            filepath = filepaths[idx]
+            if not os.path.exists(filepath):
+                continue
             
-            # Check if file needs reprocessing
-            needs_reprocess = False
+            text = texts[idx]
+            confidence = confidences[idx]
             reason = []
-            
-            # Low confidence
-            if confidence < self.quality_threshold:
-                needs_reprocess = True
+            if low_conf[idx]:
                 reason.append(f"Low confidence ({confidence:.1f}%)")
-            
-            # Very short text
-            if len(text.strip()) < 10:
-                needs_reprocess = True
+            if short_text[idx]:
                 reason.append("Very short text")
-            
-            # Garbled text indicators
-            if re.search(r'(.)\1{4,}', text):  # Repeated characters
-                needs_reprocess = True
+            if repeated[idx]:
                 reason.append("Repeated characters")
+            if many_short[idx]:
+                reason.append("Many short words (garbled)")
             
-            # Too many single/double character words (garbled)
-            words = text.split()
-            if len(words) > 5:
-                short_words = [w for w in words if len(w) <= 2 and w.isalpha()]
-                if len(short_words) > len(words) * 0.3:  # >30% very short words
-                    needs_reprocess = True
-                    reason.append("Many short words (garbled)")
-            
-            if needs_reprocess and filepath and os.path.exists(filepath):
-                problem_files.append({
-                    'filename': filename,
-                    'filepath': filepath,
-                    'original_confidence': confidence,
-                    'original_text': text[:100] + "..." if len(text) > 100 else text,
-                    'reasons': "; ".join(reason)
-                })
+            problem_files.append({
+                'filename': filenames[idx],
+                'filepath': filepath,
+                'original_confidence': confidence,
+                'original_text': text[:100] + "..." if len(text) > 100 else text,
+                'reasons': "; ".join(reason)
+            })
         
         print(f"   Found {len(problem_files)} files needing reprocessing")
         return problem_files
@@ -105,6 +118,12 @@ class SmartOCRReprocessor:
             df = pd.DataFrame(results)
             df['reprocessed_date'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            if HAS_PYARROW:
+                # Typed, compressed copy for fast reloads; mixed-type columns can't be stored
+                try:
+                    write_parquet(df, Path(output_file).with_suffix('.parquet'), compression='zstd', index=False)
+                except PARQUET_ERRORS as e:
+                    print(f"   ⚠️ Parquet copy skipped: {e}")
             
             print(f"✅ Reprocessing complete!")
             print(f"   Saved {len(results)} results to {output_file}")
@@ -3,39 +3,51 @@
 # File: streamlit_app.py (Main Interface - DEMO MODE)
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import hashlib
-import time
 import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd 
 
 # --- CORE INTEGRITY & STORAGE FUNCTIONS (DEMO MODE) ---
 
-def calculate_sha256_of_uploaded_file(uploaded_file):
-    """Calculates the SHA-256 hash of an uploaded file without saving it permanently."""
-    temp_dir = tempfile.gettempdir()
-    temp_file_path = os.path.join(temp_dir, uploaded_file.name + str(time.time()))
-    calculated_hash = None
-    
-    try:
-        with open(temp_file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer()) 
-            
-        hash_sha256 = hashlib.sha256()
-        with open(temp_file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-            
-        calculated_hash = hash_sha256.hexdigest()
-        
-    except Exception as e:
-        st.error(f"Integrity Engine Error during Hashing: {e}")
-        
-    finally:
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-
-    return calculated_hash
+# Uploads above this size are hashed in 1 MB reads rather than from one big buffer view
+LARGE_UPLOAD_BYTES = 100 * 1024 * 1024
+HASH_CHUNK_SIZE = 1 << 20
+# hashlib releases the GIL on large buffers, so a few threads hash uploads in parallel
+MAX_HASH_WORKERS = 8
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _sha256_of_upload(file_id, _uploaded_file):
+    """SHA-256 of an upload, memoized on Streamlit's per-upload file_id so reruns never rehash it.
+    The leading underscore keeps the file object itself out of the cache key."""
+    if _uploaded_file.size <= LARGE_UPLOAD_BYTES:
+        return hashlib.sha256(_uploaded_file.getbuffer()).hexdigest()
+
+    hash_sha256 = hashlib.sha256()
+    _uploaded_file.seek(0)
+    while chunk := _uploaded_file.read(HASH_CHUNK_SIZE):
+        hash_sha256.update(chunk)
+    _uploaded_file.seek(0)
+    return hash_sha256.hexdigest()
+
+def calculate_sha256_of_uploaded_files(uploaded_files):
+    """Hashes several uploads concurrently, returning hashes in upload order (None on failure)."""
+    # Only the hashing runs on worker threads; Streamlit calls stay on the script thread.
+    # The workers carry this run's script context, which the cached hash function needs
+    with ThreadPoolExecutor(max_workers=min(MAX_HASH_WORKERS, len(uploaded_files)),
+                            initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())) as executor:
+        futures = [executor.submit(_sha256_of_upload, f.file_id, f) for f in uploaded_files]
+
+    hashes = []
+    for future in futures:
+        try:
+            hashes.append(future.result())
+        except Exception as e:
+            st.error(f"Integrity Engine Error during Hashing: {e}")
+            hashes.append(None)
+    return hashes
 
 def process_and_log_evidence_mock(uploaded_file, file_hash):
     """Mocks the evidence logging process for the demo."""
@@ -80,12 +92,11 @@ def upload_evidence_tab():
         if st.button("Process & Verify Evidence Integrity", type="primary"):
             with st.spinner("Calculating Integrity Fingerprints..."):
                 results_list = []
+                hash_values = calculate_sha256_of_uploaded_files(uploaded_files)
                 
-                for file in uploaded_files:
+                for file, hash_value in zip(uploaded_files, hash_values):
                     st.write(f"Processing: **{file.name}**...")
                     try:
-                        hash_value = calculate_sha256_of_uploaded_file(file)
-                        
                         if hash_value:
                             status_message, data = process_and_log_evidence_mock(file, hash_value)
                             results_list.append(data)
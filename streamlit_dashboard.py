@@ -12,11 +12,18 @@ try:
     HAS_PLOTLY = True
 except ImportError:
     HAS_PLOTLY = False
+# PyArrow backs st.dataframe as well as the Parquet mirrors
+from parquet_mirror import HAS_PYARROW, load_with_mirror
 from pathlib import Path
+import ast
+import html
+import io
 import json
 from datetime import datetime
+import subprocess
 import sys
 import os
+import time
 
 # Page configuration
 st.set_page_config(
@@ -26,6 +33,292 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Columns the dashboard pages actually use; the rest of each CSV is never parsed
+INDEX_COLUMNS = ('exhibit_number', 'exhibit_name', 'filename', 'priority', 'categories', 'weighted_score',
+                 'verification_status', 'date_extracted', 'text_preview')
+RESULTS_COLUMNS = ('filename', 'sender', 'recipient', 'char_count', 'formatted_text')
+
+# Project folder and README opened from the About page, resolved once at startup
+PROJECT_DIR = Path.cwd()
+README_PATH = PROJECT_DIR / "README.md"
+
+# Static About page text
+ABOUT_MD = """
+### 📋 About This System
+
+**Harper's Evidence Processor** is a comprehensive legal evidence management system designed to automate 
+the processing and organization of digital evidence for legal proceedings.
+
+#### 🎯 Key Features
+- **Automated OCR**: Extract text from screenshots and images
+- **Smart Categorization**: AI-powered legal relevance classification
+- **Court-Ready Output**: Professional PDF exhibits with SHA-256 verification
+- **Timeline Analysis**: Visualize evidence chronologically
+- **Integrity Verification**: Cryptographic hashing for chain of custody
+
+#### 💪 What It Does
+- Processes thousands of files in hours instead of weeks
+- Saves $30,000-$75,000 in paralegal costs
+- Generates court-admissible documentation
+- Provides professional reports and analytics
+
+#### 🔧 Technology Stack
+- Python 3.7+
+- Tesseract OCR
+- ReportLab (PDF generation)
+- Streamlit (Web interface)
+- SQLite (Data management)
+- SHA-256 Cryptography
+
+#### 📊 Current Status
+- 13 integrated processing systems
+- 5,962+ evidence files processed
+- 100+ court exhibits generated
+- Successfully used in real legal cases
+"""
+ABOUT_STATUS_MD = """
+**Version:** 1.0.0  
+**Case:** FDSJ-739-24  
+**Date:** October 2025  
+**Status:** ✅ Operational
+"""
+
+CSV_MIRROR_VERSION = 1  # bump when the CSV parsing in _load_csv changes
+
+# Cached data loaders: the mtime argument is part of the cache key, so a
+# rewritten file is re-read on the next rerun instead of served stale
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _load_csv(path, mtime, usecols=None):
+    """Read a CSV through a Parquet mirror kept next to it when PyArrow is available.
+    
+    Parsing the CSV text is the slow part, so it happens once per version of the
+    file; the mirror is rebuilt whenever the CSV is newer than it.
+    """
+    if not HAS_PYARROW:
+        return pd.read_csv(path, encoding='utf-8', usecols=(lambda c: c in usecols) if usecols else None)
+    return load_with_mirror(path, lambda: pd.read_csv(path, encoding='utf-8'), CSV_MIRROR_VERSION, usecols)
+
+@st.cache_data(ttl="5m", max_entries=4, show_spinner=False)
+def _load_index(path, mtime):
+    """Exhibit index, presorted by weighted_score (the default sort) so pages and
+    filters can take it in order without sorting again"""
+    df = _load_csv(path, mtime, INDEX_COLUMNS)
+    if 'weighted_score' in df.columns:
+        df = df.sort_values('weighted_score', ascending=False, kind='mergesort').reset_index(drop=True)
+    # A handful of distinct values each: counts, filters and sorts then run on integer codes
+    for col in ('priority', 'verification_status'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _sort_order(path, mtime, key):
+    """Row labels of the exhibit index in descending order of key"""
+    return _load_index(path, mtime).sort_values(key, ascending=False, kind='mergesort').index
+
+@st.cache_data(ttl="5m", max_entries=4, show_spinner=False)
+def _load_results(path, mtime):
+    """Enhanced OCR results, plus a lowercased formatted_text so searches don't re-lowercase it.
+    
+    Returns (df, meta) where meta holds the file-level metrics shown above the table.
+    """
+    df = _load_csv(path, mtime, RESULTS_COLUMNS)
+    if 'formatted_text' in df.columns:
+        df['_ft_lower'] = df['formatted_text'].astype(str).str.lower()
+    # String categories, so filters compare against the selectbox values directly
+    # even when a column parsed as numbers (e.g. phone numbers)
+    for col in ('sender', 'recipient'):
+        if col in df.columns:
+            df[col] = df[col].astype('category').cat.rename_categories(str)
+    meta = {
+        'rows': len(df),
+        'senders': df['sender'].nunique() if 'sender' in df.columns else 0,
+        'recipients': df['recipient'].nunique() if 'recipient' in df.columns else 0,
+        'chars': int(df['char_count'].sum()) if 'char_count' in df.columns else None,
+    }
+    return df, meta
+
+@st.cache_data(ttl="5m", max_entries=4, show_spinner=False)
+def _parsed_dates(path, mtime):
+    """date_extracted as UTC datetimes (NaT where unknown), parsed once per version of the index.
+    
+    The processors write YYYYMMDD taken from the filename, so that format is parsed
+    directly; other values are tried as ISO 8601, then parsed individually.
+    """
+    raw = _load_index(path, mtime)['date_extracted']
+    if pd.api.types.is_datetime64_any_dtype(raw):
+        return raw.dt.tz_localize('UTC') if raw.dt.tz is None else raw.dt.tz_convert('UTC')
+    # Screenshots from one session share a date: parse each distinct value once and
+    # spread the results back by code (missing values get code -1, filled with NaT)
+    codes, uniques = pd.factorize(raw)
+    values = pd.Series(uniques)
+    # All-digit columns come back from read_csv as int64, or float64 when some are missing
+    text = values.astype(str).str.removesuffix('.0')
+    parsed = pd.to_datetime(text, format='%Y%m%d', errors='coerce', utc=True)
+    other = parsed.isna()
+    if other.any():
+        # An offset separated by a space ("... -0800") sends pandas to its slow
+        # per-value parser; join it to the time first
+        joined = values[other].astype(str).str.replace(r' (?=[+-]\d{2}:?\d{2}$)', '', regex=True)
+        # ISO 8601 timestamps go through pandas' dedicated ISO parser; the few distinct
+        # leftovers are parsed one by one rather than all with the first one's format
+        iso = pd.to_datetime(joined, format='ISO8601', errors='coerce', utc=True)
+        rest = iso.isna()
+        if rest.any():
+            iso[rest] = pd.to_datetime(joined[rest], format='mixed', errors='coerce', utc=True)
+        parsed[other] = iso
+    return pd.Series(parsed.array.take(codes, allow_fill=True), index=raw.index, name=raw.name)
+
+@st.cache_data(ttl="5m", max_entries=4, show_spinner=False)
+def _timeline_counts(path, mtime):
+    """Evidence items per day, grouped on datetime64 values rather than Python date objects"""
+    dates = _parsed_dates(path, mtime).dropna()
+    counts = dates.dt.floor('D').value_counts().sort_index()
+    return pd.DataFrame({'Date': counts.index.strftime('%Y-%m-%d'), 'Count': counts.to_numpy()})
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _filtered_csv_bytes(path, mtime, sender, recipient, query, _rows):
+    """The filtered enhanced OCR rows as CSV bytes, with every column of the source file.
+    
+    Keyed on the file and the filter values, so the bytes are encoded once per filter
+    rather than on every rerun; _rows (the matching row labels) is left out of the key.
+    """
+    buf = io.BytesIO()
+    _load_csv(path, mtime).loc[_rows].to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
+
+@st.cache_data(ttl="5m", max_entries=4, show_spinner=False)
+def _date_span_days(path, mtime):
+    """Days between the earliest and latest date_extracted, or None without dates"""
+    dates = _parsed_dates(path, mtime).dropna()
+    return (dates.max() - dates.min()).days if not dates.empty else None
+
+@st.cache_data(ttl="5m", max_entries=4, show_spinner=False)
+def _top_evidence(path, mtime, n=10):
+    """Highest-scoring exhibits; the index is presorted by weighted_score, so this is a head()"""
+    return _load_index(path, mtime).head(n)
+
+def _parse_categories(cats):
+    """Categories are stored as list literals like "['ASSAULT', 'THREATENING']" or as a bare name"""
+    if not isinstance(cats, str):
+        return []
+    if not cats.startswith('['):
+        return [cats]
+    try:
+        return list(ast.literal_eval(cats))
+    except (ValueError, SyntaxError, TypeError):
+        return []
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _category_series(path, mtime):
+    """One row per (exhibit, category) pair, parsed once per file version"""
+    df = _load_index(path, mtime)
+    if 'categories' not in df.columns:
+        return pd.Series(dtype=object)
+    return df['categories'].dropna().map(_parse_categories).explode().dropna()
+
+def render_table(df_in, max_rows=None, max_chars=None, max_height=420):
+    """Show a table through Streamlit's virtualized data grid.
+    
+    Without PyArrow (which st.dataframe needs) fall back to a minimal HTML table,
+    truncating cells longer than max_chars.
+    """
+    df_show = df_in.head(max_rows) if max_rows else df_in
+    if HAS_PYARROW:
+        st.dataframe(df_show, use_container_width=True, hide_index=True,
+                     height=min(max_height, 38 + 35 * len(df_show)))
+        return
+    
+    headers = ''.join(f"<th>{html.escape(str(h))}</th>" for h in df_show.columns)
+    rows_html = []
+    for row in df_show.itertuples(index=False, name=None):
+        cells = []
+        for val in row:
+            text = '' if val is None else str(val)
+            if max_chars and len(text) > max_chars:
+                text = text[:max_chars] + '…'
+            cells.append(f"<td>{html.escape(text)}</td>")
+        rows_html.append('<tr>' + ''.join(cells) + '</tr>')
+    table_html = (
+        f"<div class='simple-table-wrapper' style='max-height:{max_height}px'>"
+        "<table class='simple-table'>"
+        f"<thead><tr>{headers}</tr></thead>"
+        f"<tbody>{''.join(rows_html)}</tbody>"
+        "</table></div>"
+    )
+    st.markdown(table_html, unsafe_allow_html=True)
+
+def evidence_title(row, idx):
+    return f"**{row.get('exhibit_number', idx)}** - {row.get('priority', 'UNKNOWN')} - Score: {row.get('weighted_score', 0):.1f}"
+
+def render_evidence_detail(row):
+    """Content preview and metadata for one exhibit index row"""
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        if 'text_preview' in row and pd.notna(row['text_preview']):
+            st.markdown("**Content Preview:**")
+            preview_text = str(row['text_preview'])[:500]
+            st.text(preview_text)
+        else:
+            st.markdown("**Content Preview:**")
+            st.text("(No preview available)")
+    
+    with col2:
+        st.markdown("**Metadata:**")
+        st.markdown(f"- **Priority:** {row.get('priority', 'N/A')}")
+        st.markdown(f"- **Categories:** {row.get('categories', 'N/A')}")
+        st.markdown(f"- **Score:** {row.get('weighted_score', 0):.1f}")
+        st.markdown(f"- **Date:** {row.get('date_extracted', 'N/A')}")
+        st.markdown(f"- **File:** {row.get('filename', 'N/A')}")
+        
+        if row.get('exhibit_name'):
+            exhibit_path = Path("legal_exhibits") / row['exhibit_name']
+            if exhibit_path.exists():
+                st.markdown(f"- **PDF:** Available ✅")
+
+# Directory lookups, cached briefly so a rerun doesn't re-glob and re-stat every file
+@st.cache_data(ttl="30s", show_spinner=False)
+def _latest_index():
+    legal_dir = Path("legal_exhibits")
+    files = list(legal_dir.glob("EXHIBIT_INDEX_*.csv")) if legal_dir.exists() else []
+    return max(files, key=lambda p: p.stat().st_mtime) if files else None
+
+def _get_index_df():
+    """The latest exhibit index path and its cached frame, shared by every page.
+    
+    Returns (None, None) when no index has been generated yet.
+    """
+    latest_index = _latest_index()
+    if latest_index is None:
+        return None, None
+    return latest_index, _load_index(str(latest_index), latest_index.stat().st_mtime)
+
+@st.cache_data(ttl="10s", show_spinner=False)
+def _sidebar_file_stats():
+    """Names of the CSVs in output/ and the number of exhibit PDFs, one directory read each"""
+    csv_names = []
+    pdf_count = 0
+    if os.path.isdir('output'):
+        with os.scandir('output') as entries:
+            csv_names = [entry.name for entry in entries
+                         if entry.name.lower().endswith('.csv') and not entry.name.startswith('.') and entry.is_file()]
+    if os.path.isdir('legal_exhibits'):
+        with os.scandir('legal_exhibits') as entries:
+            pdf_count = sum(1 for entry in entries
+                            if entry.name.startswith('EXHIBIT-') and entry.name.lower().endswith('.pdf'))
+    return csv_names, pdf_count
+
+@st.cache_data(ttl="30s", show_spinner=False)
+def _list_results_csvs():
+    results_dir = Path('output')
+    return sorted(results_dir.glob('enhanced_ocr_results_*.csv'), key=lambda p: p.stat().st_mtime) if results_dir.exists() else []
+
+@st.cache_data(ttl="30s", show_spinner=False)
+def _list_preview_csvs():
+    preview_dir = Path('output')
+    return sorted(preview_dir.glob('enhanced_preview_sample_*.csv')) if preview_dir.exists() else []
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -86,16 +379,16 @@ with st.sidebar:
     output_dir = Path("output")
     legal_dir = Path("legal_exhibits")
     
-    csv_files = list(output_dir.glob("*.csv")) if output_dir.exists() else []
-    exhibit_files = list(legal_dir.glob("EXHIBIT-*.pdf")) if legal_dir.exists() else []
+    csv_names, exhibit_count = _sidebar_file_stats()
     
-    st.metric("CSV Files", len(csv_files))
-    st.metric("PDF Exhibits", len(exhibit_files))
+    st.metric("CSV Files", len(csv_names))
+    st.metric("PDF Exhibits", exhibit_count)
     
     st.markdown("---")
     st.markdown("### 🚀 Quick Actions")
     
     if st.button("🔄 Refresh Data", use_container_width=True):
+        st.cache_data.clear()
         st.rerun()
     
     if st.button("📂 Open Output Folder", use_container_width=True):
@@ -106,17 +399,225 @@ with st.sidebar:
         if legal_dir.exists():
             os.startfile(legal_dir)
 
+# Page sections that rerun on their own: widget changes inside them
+# (filters, search, paging, row selection) don't rerun the rest of the page
+@st.fragment
+def ocr_results_fragment(latest_results):
+    try:
+        res_df, res_meta = _load_results(str(latest_results), latest_results.stat().st_mtime)
+
+        # Basic metrics, computed once per file version by the loader
+        m1, m2, m3, m4 = st.columns(4)
+        with m1:
+            st.metric("Records", f"{res_meta['rows']:,}")
+        with m2:
+            st.metric("Senders", f"{res_meta['senders']:,}")
+        with m3:
+            st.metric("Recipients", f"{res_meta['recipients']:,}")
+        with m4:
+            st.metric("Total Chars", f"{res_meta['chars']:,}" if res_meta['chars'] is not None else "—")
+
+        # Filters, applied on submit rather than on every keystroke
+        with st.form("ocr_filters"):
+            f1, f2, f3 = st.columns([1,1,2])
+            with f1:
+                sender_opts = ['All']
+                if 'sender' in res_df.columns:
+                    sender_opts += sorted([s for s in res_df['sender'].cat.categories if s])
+                sel_sender = st.selectbox("Sender", sender_opts)
+            with f2:
+                recip_opts = ['All']
+                if 'recipient' in res_df.columns:
+                    recip_opts += sorted([r for r in res_df['recipient'].cat.categories if r])
+                sel_recipient = st.selectbox("Recipient", recip_opts)
+            with f3:
+                text_query = st.text_input("Search text", placeholder="Search in formatted_text…")
+            st.form_submit_button("Apply filters")
+
+        # Reuse the last filtered frame while neither the file nor the filters change,
+        # e.g. when only the row slider moves
+        filter_key = (str(latest_results), latest_results.stat().st_mtime, sel_sender, sel_recipient, text_query)
+        if st.session_state.get('ocr_filt_key') == filter_key:
+            filt = st.session_state.ocr_filt
+        else:
+            filt = res_df
+            if sel_sender != 'All' and 'sender' in filt.columns:
+                filt = filt[filt['sender'] == sel_sender]
+            if sel_recipient != 'All' and 'recipient' in filt.columns:
+                filt = filt[filt['recipient'] == sel_recipient]
+            if text_query and '_ft_lower' in filt.columns:
+                # Plain substring match against the pre-lowercased text
+                filt = filt[filt['_ft_lower'].str.contains(text_query.lower(), regex=False, na=False)]
+            st.session_state.ocr_filt_key = filter_key
+            st.session_state.ocr_filt = filt
+
+        # Limit rows for rendering
+        max_rows = st.slider("Rows to show", 10, 200, 50)
+        view_cols = [c for c in ['filename','sender','recipient','char_count','formatted_text'] if c in filt.columns]
+        sub = filt[view_cols].head(max_rows) if view_cols else filt.head(max_rows)
+
+        render_table(sub, max_chars=400, max_height=460)
+
+        # Download filtered
+        if not filt.empty:
+            csv_bytes = _filtered_csv_bytes(str(latest_results), latest_results.stat().st_mtime,
+                                            sel_sender, sel_recipient, text_query, filt.index)
+            st.download_button(
+                label=f"⬇️ Download filtered CSV ({len(filt):,} rows)",
+                data=csv_bytes,
+                file_name=f"enhanced_ocr_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime='text/csv'
+            )
+
+        st.caption(f"Showing {len(sub):,} of {len(filt):,} filtered rows from {latest_results.name}")
+    except Exception as e:
+        st.warning(f"Could not load latest enhanced OCR results: {e}")
+
+@st.fragment
+def evidence_browser_fragment(latest_index, df):
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        # Priority filter
+        priorities = ['All'] + df['priority'].cat.categories.tolist() if 'priority' in df.columns else ['All']
+        selected_priority = st.selectbox("🎯 Priority", priorities)
+    
+    with col2:
+        # Category filter
+        all_categories = _category_series(str(latest_index), latest_index.stat().st_mtime).unique()
+        
+        categories = ['All'] + sorted(all_categories.tolist())
+        selected_category = st.selectbox("📋 Category", categories)
+    
+    with col3:
+        # Search
+        search_query = st.text_input("🔍 Search", placeholder="Search text content...")
+    
+    # Apply filters
+    filtered_df = df.copy()
+    
+    if selected_priority != 'All':
+        filtered_df = filtered_df[filtered_df['priority'] == selected_priority]
+    
+    if selected_category != 'All' and 'categories' in df.columns:
+        filtered_df = filtered_df[filtered_df['categories'].str.contains(selected_category, na=False)]
+    
+    if search_query and 'text_preview' in df.columns:
+        filtered_df = filtered_df[filtered_df['text_preview'].str.contains(search_query, case=False, na=False)]
+    
+    # Display results
+    st.markdown(f"### 📊 Showing {len(filtered_df):,} of {len(df):,} items")
+    
+    # Sorting
+    sort_by = st.selectbox(
+        "Sort by:",
+        ['weighted_score', 'exhibit_number', 'priority', 'date_extracted'] if 'weighted_score' in df.columns else df.columns.tolist()
+    )
+    
+    # The index is already in weighted_score order; other keys reuse a cached order
+    if sort_by != 'weighted_score':
+        order = _sort_order(str(latest_index), latest_index.stat().st_mtime, sort_by)
+        filtered_df = filtered_df.loc[order[order.isin(filtered_df.index)]]
+    
+    # Pagination
+    items_per_page = 50
+    total_pages = (len(filtered_df) - 1) // items_per_page + 1
+    
+    page_num = st.slider("Page", 1, max(1, total_pages), 1)
+    
+    start_idx = (page_num - 1) * items_per_page
+    end_idx = start_idx + items_per_page
+    
+    page_df = filtered_df.iloc[start_idx:end_idx]
+    
+    # Display items: one selectable grid for the page, with a detail panel for the
+    # selected row only. Without PyArrow, fall back to one expander per item.
+    if HAS_PYARROW:
+        grid_cols = [c for c in ['exhibit_number', 'priority', 'weighted_score', 'categories', 'date_extracted', 'filename']
+                     if c in page_df.columns]
+        event = st.dataframe(
+            page_df[grid_cols] if grid_cols else page_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="evidence_grid"
+        )
+        if event.selection.rows:
+            idx = page_df.index[event.selection.rows[0]]
+            row = page_df.loc[idx]
+            st.markdown(evidence_title(row, idx))
+            render_evidence_detail(row)
+        else:
+            st.caption("Select a row to see its content preview and metadata.")
+    else:
+        for idx, row in page_df.iterrows():
+            with st.expander(evidence_title(row, idx)):
+                render_evidence_detail(row)
+
+@st.fragment
+def report_options_fragment():
+    report_type = st.selectbox(
+        "Report Type:",
+        [
+            "Executive Summary",
+            "Detailed Timeline",
+            "Category Analysis",
+            "Court Submission Report",
+            "Evidence Statistics"
+        ]
+    )
+    
+    output_format = st.radio("Output Format:", ["PDF", "Word (DOCX)", "HTML"])
+    
+    include_charts = st.checkbox("Include Charts & Graphs", value=True)
+    include_preview = st.checkbox("Include Evidence Preview", value=True)
+    include_stats = st.checkbox("Include Statistical Analysis", value=True)
+    
+    if st.button("📄 Generate Report", type="primary", use_container_width=True):
+        with st.spinner("Generating report..."):
+            # Simulate report generation
+            time.sleep(2)
+            
+            st.success("✅ Report generated successfully!")
+            st.info(f"Report saved to: `reports/{report_type.replace(' ', '_').lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{output_format.lower().split()[0]}`")
+
+@st.fragment
+def about_panel_fragment():
+    st.markdown("### 📈 System Statistics")
+    
+    st.info(ABOUT_STATUS_MD)
+    
+    st.markdown("### 📚 Documentation")
+    st.markdown("- [README.md](README.md)")
+    st.markdown("- [Legal Triage Guide](LEGAL_TRIAGE_GUIDE.md)")
+    st.markdown("- [Quick Summary](QUICK_SUMMARY.md)")
+    
+    st.markdown("### 🚀 Quick Actions")
+    if st.button("📂 Open Project Folder", use_container_width=True):
+        os.startfile(PROJECT_DIR)
+    
+    if st.button("📖 View Documentation", use_container_width=True):
+        os.startfile(README_PATH)
+    
+    st.markdown("### ⚡ Performance")
+    st.metric("Processing Speed", "50-100 files/min")
+    st.metric("OCR Accuracy", "90-95%")
+    st.metric("Files Processed", "5,962+")
+
 # Main content area
 if page == "🏠 Dashboard":
     st.markdown('<div class="main-header">📊 Evidence Dashboard</div>', unsafe_allow_html=True)
     
-    # Load exhibit index if available
-    exhibit_index_files = list(Path("legal_exhibits").glob("EXHIBIT_INDEX_*.csv")) if Path("legal_exhibits").exists() else []
+    # Load the most recent exhibit index if available
+    latest_index, df = _get_index_df()
     
-    if exhibit_index_files:
-        # Load the most recent exhibit index
-        latest_index = max(exhibit_index_files, key=lambda p: p.stat().st_mtime)
-        df = pd.read_csv(latest_index)
+    if latest_index:
+        
+        # One counting pass per column, shared by the metrics and the priority distribution
+        priority_counts = df['priority'].value_counts() if 'priority' in df.columns else None
+        verification_counts = df['verification_status'].value_counts() if 'verification_status' in df.columns else None
         
         # Top metrics
         col1, col2, col3, col4 = st.columns(4)
@@ -129,7 +630,7 @@ if page == "🏠 Dashboard":
             )
         
         with col2:
-            high_priority = len(df[df['priority'].isin(['HIGH', 'CRITICAL'])]) if 'priority' in df.columns else 0
+            high_priority = int(priority_counts.get('HIGH', 0) + priority_counts.get('CRITICAL', 0)) if priority_counts is not None else 0
             st.metric(
                 label="🔴 High Priority",
                 value=f"{high_priority:,}",
@@ -137,7 +638,7 @@ if page == "🏠 Dashboard":
             )
         
         with col3:
-            verified = len(df[df['verification_status'] == 'VERIFIED']) if 'verification_status' in df.columns else 0
+            verified = int(verification_counts.get('VERIFIED', 0)) if verification_counts is not None else 0
             st.metric(
                 label="✅ Verified",
                 value=f"{verified:,}",
@@ -162,36 +663,12 @@ if page == "🏠 Dashboard":
             
             # Category breakdown
             if 'categories' in df.columns:
-                # Parse categories (they're stored as strings like "['ASSAULT', 'THREATENING']")
-                all_categories = []
-                for cats in df['categories'].dropna():
-                    try:
-                        if isinstance(cats, str):
-                            cats_list = eval(cats) if cats.startswith('[') else [cats]
-                            all_categories.extend(cats_list)
-                    except:
-                        pass
+                all_categories = _category_series(str(latest_index), latest_index.stat().st_mtime)
                 
-                if all_categories:
-                    category_counts = pd.Series(all_categories).value_counts()
-                    # Render small HTML table to avoid Arrow
+                if not all_categories.empty:
+                    category_counts = all_categories.value_counts()
                     cat_df = category_counts.reset_index(name='Count').rename(columns={'index': 'Category'})
-                    import html
-                    headers = ''.join(f"<th style='text-align:left;padding:6px 8px;'>{html.escape(str(h))}</th>" for h in cat_df.columns)
-                    rows_html = []
-                    for _, r in cat_df.iterrows():
-                        cells = ''.join(
-                            f"<td style='text-align:left;padding:6px 8px;border-top:1px solid #eee'>{html.escape(str(v))}</td>" for v in r.tolist()
-                        )
-                        rows_html.append('<tr>'+cells+'</tr>')
-                    table_html = (
-                        "<div style='overflow:auto; max-height:320px; border:1px solid #ddd; border-radius:6px'>"
-                        "<table style='width:100%; border-collapse:collapse; font-size:14px'>"
-                        f"<thead style='position:sticky; top:0; background:#fafafa'><tr>{headers}</tr></thead>"
-                        f"<tbody>{''.join(rows_html)}</tbody>"
-                        "</table></div>"
-                    )
-                    st.markdown(table_html, unsafe_allow_html=True)
+                    render_table(cat_df, max_height=320)
                 else:
                     st.info("No category data available")
             else:
@@ -200,9 +677,7 @@ if page == "🏠 Dashboard":
         with col2:
             st.subheader("🎯 Priority Distribution")
             
-            if 'priority' in df.columns:
-                priority_counts = df['priority'].value_counts()
-                
+            if priority_counts is not None:
                 # Display as metric cards
                 for priority, count in priority_counts.items():
                     color_map = {
@@ -223,34 +698,10 @@ if page == "🏠 Dashboard":
         st.subheader("📅 Evidence Timeline")
         
         if 'date_extracted' in df.columns:
-            # Parse dates
-            df['date_parsed'] = pd.to_datetime(df['date_extracted'], errors='coerce', utc=True)
-            timeline_data = df.dropna(subset=['date_parsed'])
+            timeline_counts = _timeline_counts(str(latest_index), latest_index.stat().st_mtime)
             
-            if not timeline_data.empty:
-                timeline_counts = timeline_data.groupby(timeline_data['date_parsed'].dt.date).size().reset_index()
-                timeline_counts.columns = ['Date', 'Count']
-                # Render small HTML table to avoid Arrow
-                import html
-                headers = ''.join(f"<th style='text-align:left;padding:6px 8px;'>{html.escape(str(h))}</th>" for h in ['Date','Count'])
-                rows_html = []
-                for _, r in timeline_counts.iterrows():
-                    date_str = str(r['Date'])
-                    cnt_str = str(r['Count'])
-                    rows_html.append(
-                        "<tr>"
-                        f"<td style='text-align:left;padding:6px 8px;border-top:1px solid #eee'>{html.escape(date_str)}</td>"
-                        f"<td style='text-align:left;padding:6px 8px;border-top:1px solid #eee'>{html.escape(cnt_str)}</td>"
-                        "</tr>"
-                    )
-                table_html = (
-                    "<div style='overflow:auto; max-height:320px; border:1px solid #ddd; border-radius:6px'>"
-                    "<table style='width:100%; border-collapse:collapse; font-size:14px'>"
-                    f"<thead style='position:sticky; top:0; background:#fafafa'><tr>{headers}</tr></thead>"
-                    f"<tbody>{''.join(rows_html)}</tbody>"
-                    "</table></div>"
-                )
-                st.markdown(table_html, unsafe_allow_html=True)
+            if not timeline_counts.empty:
+                render_table(timeline_counts, max_height=320)
             else:
                 st.info("No date information available for timeline")
         else:
@@ -261,44 +712,17 @@ if page == "🏠 Dashboard":
         # Top evidence preview
         st.subheader("🔝 Top Priority Evidence")
         
-        # Sort by weighted score if available
-        if 'weighted_score' in df.columns:
-            top_evidence = df.nlargest(10, 'weighted_score')
-        else:
-            top_evidence = df.head(10)
+        # Highest weighted score first when scores are available (the index is loaded presorted)
+        top_evidence = _top_evidence(str(latest_index), latest_index.stat().st_mtime)
         
         # Display in a nice table
         display_cols = ['exhibit_number', 'priority', 'categories', 'weighted_score', 'text_preview']
         available_cols = [col for col in display_cols if col in top_evidence.columns]
         
-        def render_html_table(df_in):
-            # Minimal HTML table renderer to avoid PyArrow usage
-            import html
-            max_rows = 15
-            df_show = df_in.head(max_rows)
-            headers = ''.join(f"<th style='text-align:left;padding:6px 8px;'>{html.escape(str(h))}</th>" for h in df_show.columns)
-            rows_html = []
-            for _, r in df_show.iterrows():
-                cells = []
-                for val in r.tolist():
-                    text = '' if val is None else str(val)
-                    if len(text) > 200:
-                        text = text[:200] + '…'
-                    cells.append(f"<td style='vertical-align:top;text-align:left;padding:6px 8px;border-top:1px solid #eee'>{html.escape(text)}" + "</td>")
-                rows_html.append('<tr>' + ''.join(cells) + '</tr>')
-            table_html = (
-                "<div style='overflow:auto; max-height:420px; border:1px solid #ddd; border-radius:6px'>"
-                "<table style='width:100%; border-collapse:collapse; font-size:14px'>"
-                f"<thead style='position:sticky; top:0; background:#fafafa'><tr>{headers}</tr></thead>"
-                f"<tbody>{''.join(rows_html)}</tbody>"
-                "</table></div>"
-            )
-            st.markdown(table_html, unsafe_allow_html=True)
-
         if available_cols:
-            render_html_table(top_evidence[available_cols])
+            render_table(top_evidence[available_cols], max_rows=15, max_chars=200)
         else:
-            render_html_table(top_evidence.head())
+            render_table(top_evidence.head(), max_chars=200)
         
     else:
         st.info("📁 No exhibit index found. Run the Legal Triage Suite to generate evidence data.")
@@ -321,101 +745,24 @@ if page == "🏠 Dashboard":
         """)
         
         # Show available CSV files
-        if csv_files:
+        if csv_names:
             st.markdown("### 📄 Available CSV Files")
-            for csv_file in csv_files[:10]:
-                st.markdown(f"- `{csv_file.name}`")
+            for csv_name in csv_names[:10]:
+                st.markdown(f"- `{csv_name}`")
 
     # Enhanced OCR Results section (auto-detect latest results CSV)
     st.markdown("---")
     st.markdown("### 🧠 Enhanced OCR Results (latest)")
-    results_dir = Path('output')
-    results_csvs = sorted(results_dir.glob('enhanced_ocr_results_*.csv'), key=lambda p: p.stat().st_mtime) if results_dir.exists() else []
+    results_csvs = _list_results_csvs()
     if results_csvs:
         latest_results = results_csvs[-1]
-        try:
-            res_df = pd.read_csv(latest_results, encoding='utf-8')
-
-            # Basic metrics
-            total_rows = len(res_df)
-            unique_senders = res_df['sender'].nunique() if 'sender' in res_df.columns else 0
-            unique_recipients = res_df['recipient'].nunique() if 'recipient' in res_df.columns else 0
-            total_chars = int(res_df['char_count'].sum()) if 'char_count' in res_df.columns else None
-
-            m1, m2, m3, m4 = st.columns(4)
-            with m1:
-                st.metric("Records", f"{total_rows:,}")
-            with m2:
-                st.metric("Senders", f"{unique_senders:,}")
-            with m3:
-                st.metric("Recipients", f"{unique_recipients:,}")
-            with m4:
-                st.metric("Total Chars", f"{total_chars:,}" if total_chars is not None else "—")
-
-            # Filters
-            f1, f2, f3 = st.columns([1,1,2])
-            with f1:
-                sender_opts = ['All']
-                if 'sender' in res_df.columns:
-                    sender_opts += sorted([s for s in res_df['sender'].dropna().astype(str).unique() if s])
-                sel_sender = st.selectbox("Sender", sender_opts)
-            with f2:
-                recip_opts = ['All']
-                if 'recipient' in res_df.columns:
-                    recip_opts += sorted([r for r in res_df['recipient'].dropna().astype(str).unique() if r])
-                sel_recipient = st.selectbox("Recipient", recip_opts)
-            with f3:
-                text_query = st.text_input("Search text", placeholder="Search in formatted_text…")
-
-            filt = res_df
-            if sel_sender != 'All' and 'sender' in filt.columns:
-                filt = filt[filt['sender'].astype(str) == sel_sender]
-            if sel_recipient != 'All' and 'recipient' in filt.columns:
-                filt = filt[filt['recipient'].astype(str) == sel_recipient]
-            if text_query:
-                colname = 'formatted_text' if 'formatted_text' in filt.columns else None
-                if colname:
-                    filt = filt[filt[colname].astype(str).str.contains(text_query, case=False, na=False)]
-
-            # Limit rows for rendering
-            max_rows = st.slider("Rows to show", 10, 200, 50)
-            view_cols = [c for c in ['filename','sender','recipient','char_count','formatted_text'] if c in filt.columns]
-            sub = filt[view_cols].head(max_rows) if view_cols else filt.head(max_rows)
-
-            # Render as lightweight HTML table
-            import html as _html
-            headers = ''.join(f"<th>{_html.escape(str(h))}</th>" for h in sub.columns)
-            rows_html = []
-            for _, r in sub.iterrows():
-                tds = []
-                for v in r.tolist():
-                    txt = '' if v is None else str(v)
-                    if len(txt) > 400:
-                        txt = txt[:400] + '…'
-                    tds.append(f"<td>{_html.escape(txt)}</td>")
-                rows_html.append('<tr>' + ''.join(tds) + '</tr>')
-            table_html = (
-                "<div class='simple-table-wrapper'>"
-                "<table class='simple-table'>"
-                f"<thead><tr>{headers}</tr></thead>"
-                f"<tbody>{''.join(rows_html)}</tbody>"
-                "</table></div>"
-            )
-            st.markdown(table_html, unsafe_allow_html=True)
-
-            # Download filtered
-            if not filt.empty:
-                csv_bytes = filt.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label=f"⬇️ Download filtered CSV ({len(filt):,} rows)",
-                    data=csv_bytes,
-                    file_name=f"enhanced_ocr_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime='text/csv'
-                )
+        # The results CSV can be very large; only read it when asked to
+        show_ocr = st.checkbox(f"Load enhanced OCR results ({latest_results.name})", key='show_ocr')
+        if not show_ocr:
+            st.caption("Tick the box above to load, filter and download the latest enhanced OCR results.")
+        else:
+            ocr_results_fragment(latest_results)
 
-            st.caption(f"Showing {len(sub):,} of {len(filt):,} filtered rows from {latest_results.name}")
-        except Exception as e:
-            st.warning(f"Could not load latest enhanced OCR results: {e}")
     else:
         st.info("No enhanced_ocr_results_*.csv found in output/ yet. This will populate after the full enhanced OCR run completes.")
 
@@ -423,36 +770,17 @@ if page == "🏠 Dashboard":
     st.markdown("---")
     st.markdown("### 🔎 Load Enhanced OCR Preview (optional)")
     preview_dir = Path('output')
-    preview_csvs = sorted(preview_dir.glob('enhanced_preview_sample_*.csv')) if preview_dir.exists() else []
+    preview_csvs = _list_preview_csvs()
     if preview_csvs:
         picked = st.selectbox('Enhanced preview CSV:', [p.name for p in preview_csvs], index=len(preview_csvs)-1)
         picked_path = preview_dir / picked
         try:
-            prev_df = pd.read_csv(picked_path, encoding='utf-8')
+            prev_df = _load_csv(str(picked_path), picked_path.stat().st_mtime)
             st.markdown("#### Preview records")
-            # Render as HTML table to avoid Arrow
-            import html as _html
             max_rows = 25
             cols = [c for c in ['filename','sender','recipient','char_count','formatted_text'] if c in prev_df.columns]
             sub = prev_df[cols].head(max_rows) if cols else prev_df.head(max_rows)
-            headers = ''.join(f"<th style='text-align:left;padding:6px 8px;'>{_html.escape(str(h))}</th>" for h in sub.columns)
-            rows_html = []
-            for _, r in sub.iterrows():
-                cells = []
-                for v in r.tolist():
-                    txt = '' if v is None else str(v)
-                    if len(txt) > 200:
-                        txt = txt[:200] + '…'
-                    cells.append(f"<td style='vertical-align:top;text-align:left;padding:6px 8px;border-top:1px solid #eee'>{_html.escape(txt)}</td>")
-                rows_html.append('<tr>' + ''.join(cells) + '</tr>')
-            table_html = (
-                "<div class='simple-table-wrapper'>"
-                "<table class='simple-table'>"
-                f"<thead><tr>{headers}</tr></thead>"
-                f"<tbody>{''.join(rows_html)}</tbody>"
-                "</table></div>"
-            )
-            st.markdown(table_html, unsafe_allow_html=True)
+            render_table(sub, max_chars=200, max_height=460)
         except Exception as e:
             st.warning(f"Could not load preview CSV: {e}")
     else:
@@ -462,99 +790,10 @@ elif page == "📁 Evidence Browser":
     st.markdown('<div class="main-header">📁 Evidence Browser</div>', unsafe_allow_html=True)
     
     # Load exhibit index
-    exhibit_index_files = list(Path("legal_exhibits").glob("EXHIBIT_INDEX_*.csv")) if Path("legal_exhibits").exists() else []
+    latest_index, df = _get_index_df()
     
-    if exhibit_index_files:
-        latest_index = max(exhibit_index_files, key=lambda p: p.stat().st_mtime)
-        df = pd.read_csv(latest_index)
-        
-        # Filters
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            # Priority filter
-            priorities = ['All'] + sorted(df['priority'].unique().tolist()) if 'priority' in df.columns else ['All']
-            selected_priority = st.selectbox("🎯 Priority", priorities)
-        
-        with col2:
-            # Category filter
-            all_categories = set()
-            if 'categories' in df.columns:
-                for cats in df['categories'].dropna():
-                    try:
-                        if isinstance(cats, str):
-                            cats_list = eval(cats) if cats.startswith('[') else [cats]
-                            all_categories.update(cats_list)
-                    except:
-                        pass
-            
-            categories = ['All'] + sorted(list(all_categories))
-            selected_category = st.selectbox("📋 Category", categories)
-        
-        with col3:
-            # Search
-            search_query = st.text_input("🔍 Search", placeholder="Search text content...")
-        
-        # Apply filters
-        filtered_df = df.copy()
-        
-        if selected_priority != 'All':
-            filtered_df = filtered_df[filtered_df['priority'] == selected_priority]
-        
-        if selected_category != 'All' and 'categories' in df.columns:
-            filtered_df = filtered_df[filtered_df['categories'].str.contains(selected_category, na=False)]
-        
-        if search_query and 'text_preview' in df.columns:
-            filtered_df = filtered_df[filtered_df['text_preview'].str.contains(search_query, case=False, na=False)]
-        
-        # Display results
-        st.markdown(f"### 📊 Showing {len(filtered_df):,} of {len(df):,} items")
-        
-        # Sorting
-        sort_by = st.selectbox(
-            "Sort by:",
-            ['weighted_score', 'exhibit_number', 'priority', 'date_extracted'] if 'weighted_score' in df.columns else df.columns.tolist()
-        )
-        
-        filtered_df = filtered_df.sort_values(sort_by, ascending=False)
-        
-        # Pagination
-        items_per_page = 50
-        total_pages = (len(filtered_df) - 1) // items_per_page + 1
-        
-        page_num = st.slider("Page", 1, max(1, total_pages), 1)
-        
-        start_idx = (page_num - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        
-        page_df = filtered_df.iloc[start_idx:end_idx]
-        
-        # Display items
-        for idx, row in page_df.iterrows():
-            with st.expander(f"**{row.get('exhibit_number', idx)}** - {row.get('priority', 'UNKNOWN')} - Score: {row.get('weighted_score', 0):.1f}"):
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    if 'text_preview' in row and pd.notna(row['text_preview']):
-                        st.markdown("**Content Preview:**")
-                        preview_text = str(row['text_preview'])[:500]
-                        st.text(preview_text)
-                    else:
-                        st.markdown("**Content Preview:**")
-                        st.text("(No preview available)")
-                
-                with col2:
-                    st.markdown("**Metadata:**")
-                    st.markdown(f"- **Priority:** {row.get('priority', 'N/A')}")
-                    st.markdown(f"- **Categories:** {row.get('categories', 'N/A')}")
-                    st.markdown(f"- **Score:** {row.get('weighted_score', 0):.1f}")
-                    st.markdown(f"- **Date:** {row.get('date_extracted', 'N/A')}")
-                    st.markdown(f"- **File:** {row.get('filename', 'N/A')}")
-                    
-                    if row.get('exhibit_name'):
-                        exhibit_path = Path("legal_exhibits") / row['exhibit_name']
-                        if exhibit_path.exists():
-                            st.markdown(f"- **PDF:** Available ✅")
+    if latest_index:
+        evidence_browser_fragment(latest_index, df)
     
     else:
         st.info("📁 No evidence data available. Run Legal Triage Suite first.")
@@ -590,7 +829,6 @@ elif page == "⚖️ Legal Triage":
         if st.button("🚀 Generate Court Package", type="primary", use_container_width=True):
             with st.spinner("Generating court package..."):
                 # Run legal triage
-                import subprocess
                 result = subprocess.run(
                     [sys.executable, "legal_triage_suite.py"],
                     capture_output=True,
@@ -599,6 +837,8 @@ elif page == "⚖️ Legal Triage":
                 
                 if result.returncode == 0:
                     st.success("✅ Legal Triage completed successfully!")
+                    # A new exhibit index was just written; don't wait out the lookup cache
+                    _latest_index.clear()
                     
                     # Generate PDFs if requested
                     if generate_pdfs:
@@ -649,94 +889,71 @@ elif page == "📊 Reports":
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        report_type = st.selectbox(
-            "Report Type:",
-            [
-                "Executive Summary",
-                "Detailed Timeline",
-                "Category Analysis",
-                "Court Submission Report",
-                "Evidence Statistics"
-            ]
-        )
-        
-        output_format = st.radio("Output Format:", ["PDF", "Word (DOCX)", "HTML"])
-        
-        include_charts = st.checkbox("Include Charts & Graphs", value=True)
-        include_preview = st.checkbox("Include Evidence Preview", value=True)
-        include_stats = st.checkbox("Include Statistical Analysis", value=True)
-        
-        if st.button("📄 Generate Report", type="primary", use_container_width=True):
-            with st.spinner("Generating report..."):
-                # Simulate report generation
-                import time
-                time.sleep(2)
-                
-                st.success("✅ Report generated successfully!")
-                st.info(f"Report saved to: `reports/{report_type.replace(' ', '_').lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{output_format.lower().split()[0]}`")
+        report_options_fragment()
     
     with col2:
         st.markdown("#### 📊 Quick Statistics")
         
-        exhibit_index_files = list(Path("legal_exhibits").glob("EXHIBIT_INDEX_*.csv")) if Path("legal_exhibits").exists() else []
+        latest_index, df = _get_index_df()
         
-        if exhibit_index_files:
-            latest_index = max(exhibit_index_files, key=lambda p: p.stat().st_mtime)
-            df = pd.read_csv(latest_index)
-            
+        if latest_index:
             st.metric("Total Evidence", f"{len(df):,}")
             
             if 'priority' in df.columns:
-                high_priority = len(df[df['priority'].isin(['HIGH', 'CRITICAL'])])
+                priority_counts = df['priority'].value_counts()
+                high_priority = int(priority_counts.get('HIGH', 0) + priority_counts.get('CRITICAL', 0))
                 st.metric("High Priority", f"{high_priority:,}")
             
             if 'date_extracted' in df.columns:
-                df['date_parsed'] = pd.to_datetime(df['date_extracted'], errors='coerce', utc=True)
-                date_range = df['date_parsed'].dropna()
-                if not date_range.empty:
-                    st.metric("Date Range", f"{(date_range.max() - date_range.min()).days} days")
+                span_days = _date_span_days(str(latest_index), latest_index.stat().st_mtime)
+                if span_days is not None:
+                    st.metric("Date Range", f"{span_days} days")
 
 elif page == "⚙️ Settings":
     st.markdown('<div class="main-header">⚙️ System Settings</div>', unsafe_allow_html=True)
     
     tab1, tab2, tab3 = st.tabs(["General", "Processing", "Advanced"])
     
+    # Each tab is a form: edits are sent together on Save instead of rerunning the page per keystroke
     with tab1:
         st.markdown("### 🎯 General Settings")
         
-        case_id = st.text_input("Default Case ID:", value="FDSJ-739-24")
-        party_name = st.text_input("Default Party Name:", value="Harper")
-        
-        evidence_dir = st.text_input("Evidence Directory:", value="custody_screenshots")
-        output_dir = st.text_input("Output Directory:", value="output")
-        
-        if st.button("💾 Save General Settings"):
-            st.success("✅ Settings saved!")
+        with st.form("general_settings"):
+            case_id = st.text_input("Default Case ID:", value="FDSJ-739-24")
+            party_name = st.text_input("Default Party Name:", value="Harper")
+            
+            evidence_dir = st.text_input("Evidence Directory:", value="custody_screenshots")
+            output_dir = st.text_input("Output Directory:", value="output")
+            
+            if st.form_submit_button("💾 Save General Settings"):
+                st.success("✅ Settings saved!")
     
     with tab2:
         st.markdown("### 🔍 OCR & Processing Settings")
         
-        ocr_engine = st.selectbox("OCR Engine:", ["Tesseract", "Google Vision", "Azure OCR"])
-        ocr_language = st.selectbox("Language:", ["English", "Spanish", "French", "German"])
-        
-        quality = st.slider("Processing Quality:", 1, 10, 7)
-        
-        auto_enhance = st.checkbox("Auto-enhance images", value=True)
-        skip_low_confidence = st.checkbox("Skip files below 50% confidence", value=True)
-        
-        if st.button("💾 Save Processing Settings"):
-            st.success("✅ Settings saved!")
+        with st.form("processing_settings"):
+            ocr_engine = st.selectbox("OCR Engine:", ["Tesseract", "Google Vision", "Azure OCR"])
+            ocr_language = st.selectbox("Language:", ["English", "Spanish", "French", "German"])
+            
+            quality = st.slider("Processing Quality:", 1, 10, 7)
+            
+            auto_enhance = st.checkbox("Auto-enhance images", value=True)
+            skip_low_confidence = st.checkbox("Skip files below 50% confidence", value=True)
+            
+            if st.form_submit_button("💾 Save Processing Settings"):
+                st.success("✅ Settings saved!")
     
     with tab3:
         st.markdown("### 🔐 Advanced Settings")
         
-        enable_sha256 = st.checkbox("Enable SHA-256 verification", value=True)
-        create_backup = st.checkbox("Create backup of original files", value=True)
-        chain_of_custody = st.checkbox("Enable chain of custody logging", value=True)
-        require_password = st.checkbox("Require password for sensitive operations", value=False)
-        
-        if st.button("💾 Save Advanced Settings"):
-            st.success("✅ Settings saved!")
+        with st.form("advanced_settings"):
+            enable_sha256 = st.checkbox("Enable SHA-256 verification", value=True)
+            create_backup = st.checkbox("Create backup of original files", value=True)
+            chain_of_custody = st.checkbox("Enable chain of custody logging", value=True)
+            require_password = st.checkbox("Require password for sensitive operations", value=False)
+            
+            if st.form_submit_button("💾 Save Advanced Settings"):
+                st.success("✅ Settings saved!")
 
 elif page == "ℹ️ About":
     st.markdown('<div class="main-header">ℹ️ About Harper\'s Evidence Processor</div>', unsafe_allow_html=True)
@@ -744,66 +961,10 @@ elif page == "ℹ️ About":
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown("""
-        ### 📋 About This System
-        
-        **Harper's Evidence Processor** is a comprehensive legal evidence management system designed to automate 
-        the processing and organization of digital evidence for legal proceedings.
-        
-        #### 🎯 Key Features
-        - **Automated OCR**: Extract text from screenshots and images
-        - **Smart Categorization**: AI-powered legal relevance classification
-        - **Court-Ready Output**: Professional PDF exhibits with SHA-256 verification
-        - **Timeline Analysis**: Visualize evidence chronologically
-        - **Integrity Verification**: Cryptographic hashing for chain of custody
-        
-        #### 💪 What It Does
-        - Processes thousands of files in hours instead of weeks
-        - Saves $30,000-$75,000 in paralegal costs
-        - Generates court-admissible documentation
-        - Provides professional reports and analytics
-        
-        #### 🔧 Technology Stack
-        - Python 3.7+
-        - Tesseract OCR
-        - ReportLab (PDF generation)
-        - Streamlit (Web interface)
-        - SQLite (Data management)
-        - SHA-256 Cryptography
-        
-        #### 📊 Current Status
-        - 13 integrated processing systems
-        - 5,962+ evidence files processed
-        - 100+ court exhibits generated
-        - Successfully used in real legal cases
-        """)
+        st.markdown(ABOUT_MD)
     
     with col2:
-        st.markdown("### 📈 System Statistics")
-        
-        st.info(f"""
-        **Version:** 1.0.0  
-        **Case:** FDSJ-739-24  
-        **Date:** October 2025  
-        **Status:** ✅ Operational
-        """)
-        
-        st.markdown("### 📚 Documentation")
-        st.markdown("- [README.md](README.md)")
-        st.markdown("- [Legal Triage Guide](LEGAL_TRIAGE_GUIDE.md)")
-        st.markdown("- [Quick Summary](QUICK_SUMMARY.md)")
-        
-        st.markdown("### 🚀 Quick Actions")
-        if st.button("📂 Open Project Folder", use_container_width=True):
-            os.startfile(Path.cwd())
-        
-        if st.button("📖 View Documentation", use_container_width=True):
-            os.startfile("README.md")
-        
-        st.markdown("### ⚡ Performance")
-        st.metric("Processing Speed", "50-100 files/min")
-        st.metric("OCR Accuracy", "90-95%")
-        st.metric("Files Processed", "5,962+")
+        about_panel_fragment()
 
 # Footer
 st.markdown("---")
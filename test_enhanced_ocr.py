@@ -3,46 +3,129 @@
 Quick test of enhanced OCR on a few sample files
 """
 
+import os
+
+# One Tesseract thread per process; the images are spread across processes instead
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+from concurrent.futures import ProcessPoolExecutor
 from enhanced_ocr_processor import EnhancedOCRProcessor
 from pathlib import Path
+from PIL import Image
+import io
+import multiprocessing
 import sys
+import threading
+import time
 
-def main():
-    processor = EnhancedOCRProcessor()
+SCREENSHOT_DIR = Path('custody_screenshots')
+PREVIEW_CHARS = 500
+WORKER_START_TIMEOUT = 60  # seconds
+
+_processor = None
+_ready = None
+
+
+def _init_worker(ready):
+    """Build one processor per worker process and run it once on a blank page.
     
+    pytesseract starts a new tesseract process for every call, so nothing stays
+    loaded; the blank page only pulls the binary and language data into the OS
+    file cache before the first real image"""
+    global _processor, _ready
+    _ready = ready
+    _processor = EnhancedOCRProcessor()
+    try:
+        _processor.extract_text_with_layout(Image.new('L', (64, 32), 255))
+    except Exception:
+        pass  # a missing Tesseract surfaces on the real images instead
+
+
+def _worker_ready(_):
+    """Wait until every worker has finished _init_worker; blocking here also keeps
+    one worker from taking two of these calls"""
+    try:
+        _ready.wait(timeout=WORKER_START_TIMEOUT)
+    except threading.BrokenBarrierError:
+        pass  # fewer workers came up than requested; time the run anyway
+
+
+def _process_in_worker(img_path):
+    """OCR one image and return only what the test prints, so the full text stays in the worker"""
+    result = _processor.process_image(img_path)
+    if not result:
+        return None
+    return {
+        'sender': result['sender'],
+        'recipient': result['recipient'],
+        'char_count': result['char_count'],
+        'formatted_text_head': result['formatted_text'][:PREVIEW_CHARS],
+    }
+
+
+def main():
     # Test on first 3 images
     test_files = [
-        Path('custody_screenshots/2025-01-08(149).png'),
-        Path('custody_screenshots/2025-01-08(151).png'),
-        Path('custody_screenshots/2025-01-08(150).png'),
+        SCREENSHOT_DIR / '2025-01-08(149).png',
+        SCREENSHOT_DIR / '2025-01-08(151).png',
+        SCREENSHOT_DIR / '2025-01-08(150).png',
     ]
     
     print("=== TESTING ENHANCED OCR ===\n")
     
+    # One directory listing instead of a stat per file
+    try:
+        with os.scandir(SCREENSHOT_DIR) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+    
+    existing_files = []
+    existing_names = []
     for img_path in test_files:
-        if not img_path.exists():
+        name = img_path.name
+        if name not in present:
             print(f"Skipping {img_path} (not found)")
             continue
-            
-        print(f"\n{'='*80}")
-        print(f"Processing: {img_path.name}")
-        print(f"{'='*80}\n")
-        
-        result = processor.process_image(img_path)
+        existing_files.append(img_path)
+        existing_names.append(name)
+    
+    if not existing_files:
+        print(f"No test images found in {SCREENSHOT_DIR}")
+        return
+    
+    # OCR runs in parallel; results come back in input order so the output stays readable.
+    workers = min(len(existing_files), os.cpu_count() or 1)
+    ready = multiprocessing.Barrier(workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ready,)) as ex:
+        # Start the clock only once every worker is up, so spawn and warm-up aren't counted
+        list(ex.map(_worker_ready, range(workers)))
+        start = time.perf_counter()
+        results = list(ex.map(_process_in_worker, existing_files))
+        elapsed = time.perf_counter() - start
+    
+    for name, result in zip(existing_names, results):
+        # Build each image's report in memory and write it to the console in one go
+        buf = io.StringIO()
+        print(f"\n{'='*80}", file=buf)
+        print(f"Processing: {name}", file=buf)
+        print(f"{'='*80}\n", file=buf)
         
         if result:
-            print(f"✅ Success!")
-            print(f"Sender: {result['sender']}")
-            print(f"Recipient: {result['recipient']}")
-            print(f"Text length: {result['char_count']} chars")
-            print(f"\nFormatted Text Preview (first 500 chars):")
-            print("-" * 80)
-            print(result['formatted_text'][:500])
-            print("-" * 80)
+            print(f"✅ Success!", file=buf)
+            print(f"Sender: {result['sender']}", file=buf)
+            print(f"Recipient: {result['recipient']}", file=buf)
+            print(f"Text length: {result['char_count']} chars", file=buf)
+            print(f"\nFormatted Text Preview (first {PREVIEW_CHARS} chars):", file=buf)
+            print("-" * 80, file=buf)
+            print(result['formatted_text_head'], file=buf)
+            print("-" * 80, file=buf)
         else:
-            print(f"❌ Failed to process")
+            print(f"❌ Failed to process", file=buf)
+        sys.stdout.write(buf.getvalue())
     
     print(f"\n{'='*80}")
+    print(f"OCR time: {elapsed:.1f}s for {len(existing_files)} images ({workers} workers)")
     print("Test complete! If results look good, run RUN_ENHANCED_OCR.bat")
     print(f"{'='*80}\n")
 
@@ -7,17 +7,140 @@ Case: FDSJ-739-24 - Advanced Progress Tracking & Analytics
 
 import time
 import os
+import io
+import re
 import csv
 import threading
 import json
+import queue
 import sqlite3
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
+import operator
 import psutil
 import sys
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# psutil's non-blocking cpu_percent measures since its previous call; readings
+# closer together than this would cover a near-meaningless window
+CPU_SAMPLE_MIN_INTERVAL = 0.5  # seconds
+
+# One monitoring cycle asks for the same metrics and file analysis several times;
+# results younger than these are reused instead of re-querying psutil / re-reading CSVs
+METRICS_CACHE_TTL = 2.0   # seconds
+ANALYSIS_CACHE_TTL = 3.0  # seconds
+DISK_CACHE_TTL = 30.0     # seconds; free space barely moves between cycles
+
+LINE_COUNT_CHUNK = 1 << 20  # bytes read per step when counting CSV lines
+
+# A log line is an error line if it mentions any of these keywords, in any case
+ERROR_KEYWORDS = ('error', 'failed', 'exception', 'critical', 'crashed')
+
+# Fallback without pyahocorasick: one match per line, since each match must start at a line start
+ERROR_LINE_RE = re.compile(
+    rb'^[^\n]*?(?:' + b'|'.join(k.encode() for k in ERROR_KEYWORDS) + rb')', re.MULTILINE | re.IGNORECASE
+)
+
+if HAS_AHOCORASICK:
+    # Single automaton over all keywords: one pass over the log text
+    ERROR_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in ERROR_KEYWORDS:
+        ERROR_AUTOMATON.add_word(_keyword, _keyword)
+    ERROR_AUTOMATON.make_automaton()
+else:
+    ERROR_AUTOMATON = None
+
+# Output CSV name pattern for each processing type
+FILE_PATTERNS = {
+    'ocr_processing': 'harper_ocr_results_*.csv',
+    'enhanced_processing': 'harper_enhanced_results_*.csv',
+    'secure_processing': 'harper_evidence_*.csv',
+    'advanced_processing': 'advanced_evidence_results_*.csv'
+}
+
+# Dashboard labels and icons
+PROCESSING_TYPES = (
+    ('OCR Processing', 'ocr_processing', '🔍'),
+    ('Enhanced Quality', 'enhanced_processing', '💎'),
+    ('Secure Processing', 'secure_processing', '🔐'),
+    ('Advanced Processing', 'advanced_processing', '📄')
+)
+STATUS_ICONS = {
+    'healthy': '🟢',
+    'warning': '🟡', 
+    'critical': '🔴',
+    'error': '⚫',
+    'unknown': '⚪'
+}
+TYPE_ICONS = {
+    'images': '🖼️',
+    'documents': '📄',
+    'videos': '🎬',
+    'audio': '🔊',
+    'other': '📁'
+}
+SEVERITY_ICONS = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟢'}
+
+# Evidence file extension -> inventory bucket; anything else counts as 'other'
+EVIDENCE_EXT_CATEGORY = {
+    **dict.fromkeys(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'), 'images'),
+    **dict.fromkeys(('.pdf', '.doc', '.docx', '.txt', '.rtf'), 'documents'),
+    **dict.fromkeys(('.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'), 'videos'),
+    **dict.fromkeys(('.mp3', '.wav', '.m4a', '.ogg', '.flac'), 'audio'),
+}
+
+# Clear screen and move the cursor home, written directly instead of spawning cls/clear
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
+# How often the dashboard loop looks for a finished check; short so Ctrl+C stays responsive
+DISPLAY_POLL_INTERVAL = 0.2  # seconds
+
+ALERT_HISTORY = 1024  # session alerts kept in memory; every alert is also in the database
+
+SNAPSHOT_FLUSH_EVERY = 12  # queued snapshots per database commit (~1 minute at 5 s refresh)
+
+# (results section, key, comparison, threshold, recommendation); a missing value reads as 0
+RECOMMENDATION_RULES = (
+    ('system_metrics', 'memory_usage', operator.gt, 80,
+     "High memory usage detected - consider reducing batch sizes"),
+    ('system_metrics', 'cpu_usage', operator.gt, 90,
+     "High CPU usage - consider running fewer concurrent processes"),
+    ('system_metrics', 'disk_usage', operator.gt, 85,
+     "Low disk space - run cleanup or add storage"),
+    ('file_analysis', 'total_records', operator.eq, 0,
+     "No processing activity detected - check if processors are running"),
+    ('health_status', 'last_activity_minutes', operator.gt, 30,
+     "Long period without processing activity - verify system status"),
+    ('evidence_inventory', 'total', operator.eq, 0,
+     "No evidence files found - verify evidence directory structure")
+)
+
+# (snapshot column, trend key, average key) summarized in monitoring reports
+TREND_COLUMNS = (
+    ('cpu_usage', 'cpu_trend', 'avg_cpu'),
+    ('memory_usage', 'memory_trend', 'avg_memory'),
+    ('processing_rate', 'processing_trend', 'avg_processing_rate')
+)
+
+# Snapshot count, then per trend column: non-NULL count, average, newest and oldest
+# non-NULL reading; all reduced inside SQLite, the endpoints via the timestamp index
+TREND_QUERY = 'SELECT COUNT(*), ' + ', '.join(
+    f'''COUNT({col}), AVG({col}),
+    (SELECT {col} FROM progress_snapshots WHERE timestamp >= :cutoff AND {col} IS NOT NULL
+     ORDER BY timestamp DESC LIMIT 1),
+    (SELECT {col} FROM progress_snapshots WHERE timestamp >= :cutoff AND {col} IS NOT NULL
+     ORDER BY timestamp ASC LIMIT 1)'''
+    for col, _, _ in TREND_COLUMNS
+) + ' FROM progress_snapshots WHERE timestamp >= :cutoff'
+
 class UltimateProgressMonitor:
     """Advanced real-time monitoring system for all evidence processing activities."""
     
@@ -32,6 +155,9 @@ class UltimateProgressMonitor:
         for folder in [self.output_folder, self.logs_folder, self.reports_folder]:
             folder.mkdir(exist_ok=True)
         
+        # Setup logging (the database setup below logs its outcome)
+        self.setup_logging()
+        
         # Initialize database for progress tracking
         self.init_progress_database()
         
@@ -52,11 +178,37 @@ class UltimateProgressMonitor:
             'total_processed': 0,
             'processing_rate': 0.0,
             'error_count': 0,
-            'alerts': []
+            'alerts': deque(maxlen=ALERT_HISTORY),
+            'alerts_generated': 0
         }
         
-        # Setup logging
-        self.setup_logging()
+        # Seed psutil's CPU counters so later readings cover the time between cycles
+        psutil.cpu_percent(interval=None)
+        self._cpu_sample = (time.monotonic(), None)
+        
+        # (monotonic time, result) of the last system metrics / file analysis
+        self._metrics_cache = (0.0, None)
+        self._analysis_cache = (0.0, None)
+        
+        # Filesystem to report disk usage for, and (monotonic time, (usage %, free GB)) of its last statvfs
+        self._disk_path = os.getcwd()
+        self._disk_cache = (0.0, None)
+        
+        # Results CSV path -> (st_mtime_ns, st_size, record count); finished files are counted once
+        self._record_counts = {}
+        
+        # ({folder path: st_mtime_ns}, inventory) from the last evidence walk
+        self._evidence_cache = ({}, None)
+        
+        # Log path -> (bytes already scanned, error lines counted so far)
+        self._log_scan = {}
+        
+        # Progress snapshot and alert rows waiting to be written in one transaction
+        self._snapshot_queue = []
+        self._alert_queue = []
+        
+        if os.name == 'nt':
+            os.system('')  # one-off: leaves ANSI escape handling enabled in the Windows console
         
         print(f"""
 ╔══════════════════════════════════════════════════════════════════╗
@@ -90,7 +242,15 @@ class UltimateProgressMonitor:
         db_path = self.reports_folder / 'progress_tracking.db'
         
         try:
-            self.conn = sqlite3.connect(db_path)
+            # In continuous mode the checks (and their writes) run on a background thread;
+            # the connection is only ever used by one thread at a time
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            # WAL: a commit appends to the log instead of rewriting pages, and report
+            # queries can read while snapshots are written. NORMAL syncs at checkpoints
+            # rather than on every commit, which is safe in WAL mode.
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.execute('PRAGMA temp_store=MEMORY')
             cursor = self.conn.cursor()
             
             # Create progress snapshots table
@@ -107,10 +267,16 @@ class UltimateProgressMonitor:
                     disk_usage REAL DEFAULT 0,
                     active_processes INTEGER DEFAULT 0,
                     quality_metrics TEXT,
-                    notes TEXT
+                    notes TEXT,
+                    total_files INTEGER DEFAULT 0
                 )
             ''')
             
+            # Databases created before total_files existed get the column added
+            snapshot_columns = {row[1] for row in cursor.execute('PRAGMA table_info(progress_snapshots)')}
+            if 'total_files' not in snapshot_columns:
+                cursor.execute('ALTER TABLE progress_snapshots ADD COLUMN total_files INTEGER DEFAULT 0')
+            
             # Create alerts table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS alerts (
@@ -123,7 +289,13 @@ class UltimateProgressMonitor:
                 )
             ''')
             
+            # The report reads the last 24 hours newest-first from both tables
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_snap_ts ON progress_snapshots(timestamp DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_alerts_ts ON alerts(timestamp DESC)')
+            
             self.conn.commit()
+            # Reused for every batched write instead of creating a cursor per insert
+            self._cur = cursor
             self.logger.info("Progress tracking database initialized successfully")
             
         except Exception as e:
@@ -140,28 +312,101 @@ class UltimateProgressMonitor:
         elif level == 'DEBUG':
             self.logger.debug(message)
     
+    def _cpu_percent(self) -> float:
+        """CPU usage since the previous reading, without blocking for a sample interval."""
+        sampled_at, value = self._cpu_sample
+        elapsed = time.monotonic() - sampled_at
+        if elapsed < CPU_SAMPLE_MIN_INTERVAL:
+            if value is not None:
+                return value
+            # First reading right after startup: wait out the rest of the minimum window
+            time.sleep(CPU_SAMPLE_MIN_INTERVAL - elapsed)
+        value = psutil.cpu_percent(interval=None)
+        self._cpu_sample = (time.monotonic(), value)
+        return value
+    
+    @staticmethod
+    def count_processes() -> int:
+        """Number of running processes; on Linux counted from /proc without building a PID list."""
+        if sys.platform.startswith('linux'):
+            with os.scandir('/proc') as entries:
+                return sum(1 for entry in entries if entry.name.isdigit())
+        return len(psutil.pids())
+    
+    def _disk_usage(self) -> Tuple[float, float]:
+        """Percent used and GB free on the monitored filesystem, re-read at most every DISK_CACHE_TTL."""
+        cached_at, cached = self._disk_cache
+        if cached is not None and time.monotonic() - cached_at < DISK_CACHE_TTL:
+            return cached
+        disk = psutil.disk_usage(self._disk_path)
+        cached = ((disk.used / disk.total) * 100, disk.free / (1024**3))
+        self._disk_cache = (time.monotonic(), cached)
+        return cached
+    
     def get_system_metrics(self) -> Dict:
         """Get current system performance metrics."""
+        cached_at, cached = self._metrics_cache
+        if cached is not None and time.monotonic() - cached_at < METRICS_CACHE_TTL:
+            return cached
+        
         try:
-            cpu_usage = psutil.cpu_percent(interval=1)
+            cpu_usage = self._cpu_percent()
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage(os.getcwd())
+            disk_usage, disk_free_gb = self._disk_usage()
             
-            return {
+            metrics = {
                 'cpu_usage': cpu_usage,
                 'memory_usage': memory.percent,
                 'memory_available_gb': memory.available / (1024**3),
-                'disk_usage': (disk.used / disk.total) * 100,
-                'disk_free_gb': disk.free / (1024**3),
-                'active_processes': len(psutil.pids()),
+                'disk_usage': disk_usage,
+                'disk_free_gb': disk_free_gb,
+                'active_processes': self.count_processes(),
                 'timestamp': datetime.now().isoformat()
             }
+            self._metrics_cache = (time.monotonic(), metrics)
+            return metrics
         except Exception as e:
             self.logger.error(f"Failed to get system metrics: {e}")
             return {}
 
+    @staticmethod
+    def count_lines(path: Path) -> int:
+        """Count lines on the raw bytes, without decoding or building a string per line."""
+        lines = 0
+        last = b'\n'
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(LINE_COUNT_CHUNK)
+                if not chunk:
+                    break
+                lines += chunk.count(b'\n')
+                last = chunk[-1:]
+        # A final line without a trailing newline still counts, as with iterating the file
+        return lines + (last != b'\n')
+
+    @staticmethod
+    def count_error_lines(data: bytes, end: int) -> int:
+        """Count lines in data[:end] mentioning an error keyword."""
+        if ERROR_AUTOMATON is None:
+            return len(ERROR_LINE_RE.findall(data, 0, end))
+        
+        # latin-1 maps bytes 1:1 to characters, so the ASCII keywords match without a real decode
+        text = data[:end].decode('latin-1').lower()
+        count = 0
+        line_end = -1
+        for pos, _ in ERROR_AUTOMATON.iter(text):
+            # Matches arrive in text order; count only the first one on each line
+            if pos > line_end:
+                count += 1
+                line_end = text.find('\n', pos)
+        return count
+
     def analyze_processing_files(self) -> Dict:
         """Analyze all processing output files for comprehensive status."""
+        cached_at, cached = self._analysis_cache
+        if cached is not None and time.monotonic() - cached_at < ANALYSIS_CACHE_TTL:
+            return cached
+        
         analysis = {
             'ocr_processing': {},
             'enhanced_processing': {},
@@ -174,16 +419,9 @@ class UltimateProgressMonitor:
         
         try:
             # Analyze different types of output files
-            file_patterns = {
-                'ocr_processing': 'harper_ocr_results_*.csv',
-                'enhanced_processing': 'harper_enhanced_results_*.csv',
-                'secure_processing': 'harper_evidence_*.csv',
-                'advanced_processing': 'advanced_evidence_results_*.csv'
-            }
-            
             all_files = []
             
-            for process_type, pattern in file_patterns.items():
+            for process_type, pattern in FILE_PATTERNS.items():
                 files = list(self.output_folder.glob(pattern))
                 analysis[process_type] = {
                     'file_count': len(files),
@@ -192,27 +430,39 @@ class UltimateProgressMonitor:
                     'size_mb': 0
                 }
                 
-                if files:
+                # Stat each file once; the latest file, size total and count cache all use it
+                entries = []
+                for file in files:
+                    try:
+                        entries.append((file, file.stat()))
+                    except OSError as e:
+                        self.logger.warning(f"Could not read file {file}: {e}")
+                
+                if entries:
                     # Find latest file
-                    latest_file = max(files, key=os.path.getmtime)
+                    latest_file, latest_st = max(entries, key=lambda entry: entry[1].st_mtime)
                     analysis[process_type]['latest_file'] = {
                         'name': latest_file.name,
-                        'modified': datetime.fromtimestamp(latest_file.stat().st_mtime),
-                        'size': latest_file.stat().st_size
+                        'modified': datetime.fromtimestamp(latest_st.st_mtime),
+                        'size': latest_st.st_size
                     }
                     
-                    all_files.append((latest_file, latest_file.stat().st_mtime))
+                    all_files.append((latest_file, latest_st.st_mtime))
                     
                     # Count records and calculate total size
                     total_records = 0
                     total_size = 0
                     
-                    for file in files:
+                    for file, st in entries:
                         try:
-                            with open(file, 'r', encoding='utf-8') as f:
-                                record_count = sum(1 for line in f) - 1  # Subtract header
-                                total_records += record_count
-                                total_size += file.stat().st_size
+                            cached = self._record_counts.get(str(file))
+                            if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+                                record_count = cached[2]
+                            else:
+                                record_count = max(self.count_lines(file) - 1, 0)  # Subtract header
+                                self._record_counts[str(file)] = (st.st_mtime_ns, st.st_size, record_count)
+                            total_records += record_count
+                            total_size += st.st_size
                         except Exception as e:
                             self.logger.warning(f"Could not read file {file}: {e}")
                     
@@ -232,6 +482,7 @@ class UltimateProgressMonitor:
                     'minutes_ago': (datetime.now() - datetime.fromtimestamp(latest_time)).total_seconds() / 60
                 }
             
+            self._analysis_cache = (time.monotonic(), analysis)
             return analysis
             
         except Exception as e:
@@ -244,6 +495,12 @@ class UltimateProgressMonitor:
             if not self.evidence_folder.exists():
                 return {'total': 0, 'by_type': {}, 'error': 'Evidence folder not found'}
             
+            # Adding, removing or renaming a file changes its folder's mtime, so if no
+            # folder from the last walk changed, neither did the inventory
+            folder_mtimes, cached = self._evidence_cache
+            if cached is not None and self._folders_unchanged(folder_mtimes):
+                return cached
+            
             file_counts = {
                 'images': 0,
                 'documents': 0,
@@ -252,30 +509,24 @@ class UltimateProgressMonitor:
                 'other': 0
             }
             
-            # File type categorization
-            image_exts = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp'}
-            doc_exts = {'.pdf', '.doc', '.docx', '.txt', '.rtf'}
-            video_exts = {'.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'}
-            audio_exts = {'.mp3', '.wav', '.m4a', '.ogg', '.flac'}
-            
+            # Walk with os.scandir: directory entries carry their type, so no Path
+            # object or extra stat per file (symlinked folders are not descended, as with rglob)
             total_files = 0
-            for file_path in self.evidence_folder.rglob("*"):
-                if file_path.is_file():
-                    total_files += 1
-                    ext = file_path.suffix.lower()
-                    
-                    if ext in image_exts:
-                        file_counts['images'] += 1
-                    elif ext in doc_exts:
-                        file_counts['documents'] += 1
-                    elif ext in video_exts:
-                        file_counts['videos'] += 1
-                    elif ext in audio_exts:
-                        file_counts['audio'] += 1
-                    else:
-                        file_counts['other'] += 1
-            
-            return {
+            folder_mtimes = {}
+            pending = [str(self.evidence_folder)]
+            while pending:
+                folder = pending.pop()
+                folder_mtimes[folder] = os.stat(folder).st_mtime_ns
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total_files += 1
+                            ext = os.path.splitext(entry.name)[1].lower()
+                            file_counts[EVIDENCE_EXT_CATEGORY.get(ext, 'other')] += 1
+            
+            inventory = {
                 'total': total_files,
                 'by_type': file_counts,
                 'processing_potential': {
@@ -283,13 +534,26 @@ class UltimateProgressMonitor:
                     'advanced_processing': file_counts['documents'] + file_counts['videos'] + file_counts['audio']
                 }
             }
+            self._evidence_cache = (folder_mtimes, inventory)
+            return inventory
             
         except Exception as e:
             self.logger.error(f"Failed to count evidence files: {e}")
             return {'total': 0, 'by_type': {}, 'error': str(e)}
 
-    def check_processing_health(self) -> Dict:
-        """Check the health status of processing systems."""
+    @staticmethod
+    def _folders_unchanged(folder_mtimes: Dict) -> bool:
+        """True if every folder still has the mtime recorded for it."""
+        try:
+            return all(os.stat(folder).st_mtime_ns == mtime for folder, mtime in folder_mtimes.items())
+        except OSError:
+            return False
+
+    def check_processing_health(self, analysis: Optional[Dict] = None, system_metrics: Optional[Dict] = None) -> Dict:
+        """Check the health status of processing systems.
+        
+        analysis / system_metrics: results already gathered this cycle; fetched when omitted.
+        """
         health_status = {
             'overall_status': 'unknown',
             'issues': [],
@@ -301,7 +565,8 @@ class UltimateProgressMonitor:
         
         try:
             # Check for recent activity
-            analysis = self.analyze_processing_files()
+            if analysis is None:
+                analysis = self.analyze_processing_files()
             if analysis['latest_activity']:
                 minutes_ago = analysis['latest_activity']['minutes_ago']
                 health_status['last_activity_minutes'] = minutes_ago
@@ -317,7 +582,8 @@ class UltimateProgressMonitor:
                     health_status['processing_rate'] = analysis['total_records'] / session_duration
             
             # Check system resources
-            system_metrics = self.get_system_metrics()
+            if system_metrics is None:
+                system_metrics = self.get_system_metrics()
             if system_metrics:
                 if system_metrics['memory_usage'] > (self.monitor_config['alert_thresholds']['memory_usage'] * 100):
                     health_status['issues'].append(f"High memory usage: {system_metrics['memory_usage']:.1f}%")
@@ -361,21 +627,23 @@ class UltimateProgressMonitor:
                 if datetime.fromtimestamp(log_file.stat().st_mtime) > cutoff_time:
                     recent_logs.append(log_file)
             
-            # Scan for error patterns
-            error_keywords = ['ERROR', 'FAILED', 'EXCEPTION', 'CRITICAL', 'CRASHED']
-            
+            # Scan for error patterns, reading only what was appended since the last scan
             for log_file in recent_logs:
                 try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        error_count = 0
-                        
-                        for line in lines:
-                            if any(keyword in line.upper() for keyword in error_keywords):
-                                error_count += 1
-                        
-                        if error_count > 0:
-                            error_patterns.append(f"{log_file.name}: {error_count} errors found")
+                    offset, error_count = self._log_scan.get(log_file, (0, 0))
+                    with open(log_file, 'rb') as f:
+                        if os.fstat(f.fileno()).st_size < offset:
+                            offset, error_count = 0, 0  # truncated or replaced: start over
+                        f.seek(offset)
+                        new_data = f.read()
+                    
+                    # A trailing partial line is left for the next scan
+                    end = new_data.rfind(b'\n') + 1
+                    error_count += self.count_error_lines(new_data, end)
+                    self._log_scan[log_file] = (offset + end, error_count)
+                    
+                    if error_count > 0:
+                        error_patterns.append(f"{log_file.name}: {error_count} errors found")
                             
                 except Exception as e:
                     self.logger.debug(f"Could not scan log file {log_file}: {e}")
@@ -386,12 +654,18 @@ class UltimateProgressMonitor:
             self.logger.error(f"Failed to scan logs for errors: {e}")
             return []
 
-    def record_progress_snapshot(self, processor_type: str = "monitor"):
-        """Record a progress snapshot to the database."""
+    def record_progress_snapshot(self, processor_type: str = "monitor",
+                                 analysis: Optional[Dict] = None, system_metrics: Optional[Dict] = None):
+        """Record a progress snapshot to the database.
+        
+        analysis / system_metrics: results already gathered this cycle; fetched when omitted.
+        """
         try:
             # Get current metrics
-            system_metrics = self.get_system_metrics()
-            analysis = self.analyze_processing_files()
+            if system_metrics is None:
+                system_metrics = self.get_system_metrics()
+            if analysis is None:
+                analysis = self.analyze_processing_files()
             
             # Calculate processing statistics
             processing_rate = 0.0
@@ -400,21 +674,8 @@ class UltimateProgressMonitor:
                 if session_duration > 0:
                     processing_rate = analysis['total_records'] / session_duration
             
-            # Quality metrics (placeholder for future enhancement)
-            quality_metrics = json.dumps({
-                'total_files': analysis['total_files'],
-                'total_records': analysis['total_records'],
-                'file_types': list(analysis.keys())
-            })
-            
-            # Insert snapshot
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO progress_snapshots 
-                (timestamp, processor_type, files_processed, processing_rate, 
-                 memory_usage, cpu_usage, disk_usage, active_processes, quality_metrics)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            # Queue snapshot; rows are committed in batches by flush_pending
+            self._snapshot_queue.append((
                 datetime.now().isoformat(),
                 processor_type,
                 analysis['total_records'],
@@ -423,26 +684,47 @@ class UltimateProgressMonitor:
                 system_metrics.get('cpu_usage', 0),
                 system_metrics.get('disk_usage', 0),
                 system_metrics.get('active_processes', 0),
-                quality_metrics
+                analysis['total_files']
             ))
             
-            self.conn.commit()
+            if len(self._snapshot_queue) >= SNAPSHOT_FLUSH_EVERY:
+                self.flush_pending()
             
         except Exception as e:
             self.logger.error(f"Failed to record progress snapshot: {e}")
 
-    def create_alert(self, alert_type: str, severity: str, message: str):
-        """Create an alert in the database."""
+    def flush_pending(self):
+        """Write all queued progress snapshots and alerts in a single transaction."""
+        if not self._snapshot_queue and not self._alert_queue:
+            return
+        
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO alerts (timestamp, alert_type, severity, message)
-                VALUES (?, ?, ?, ?)
-            ''', (datetime.now().isoformat(), alert_type, severity, message))
+            with self.conn:
+                if self._snapshot_queue:
+                    self._cur.executemany('''
+                        INSERT INTO progress_snapshots 
+                        (timestamp, processor_type, files_processed, processing_rate, 
+                         memory_usage, cpu_usage, disk_usage, active_processes, total_files)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', self._snapshot_queue)
+                if self._alert_queue:
+                    self._cur.executemany('''
+                        INSERT INTO alerts (timestamp, alert_type, severity, message)
+                        VALUES (?, ?, ?, ?)
+                    ''', self._alert_queue)
+            self._snapshot_queue.clear()
+            self._alert_queue.clear()
             
-            self.conn.commit()
+        except Exception as e:
+            self.logger.error(f"Failed to write progress snapshots and alerts: {e}")
+
+    def create_alert(self, alert_type: str, severity: str, message: str):
+        """Create an alert; it is written to the database with the next snapshot batch."""
+        try:
+            self._alert_queue.append((datetime.now().isoformat(), alert_type, severity, message))
             
             # Add to current session alerts
+            self.stats['alerts_generated'] += 1
             self.stats['alerts'].append({
                 'timestamp': datetime.now(),
                 'type': alert_type,
@@ -464,10 +746,10 @@ class UltimateProgressMonitor:
             system_metrics = self.get_system_metrics()
             file_analysis = self.analyze_processing_files()
             evidence_count = self.count_evidence_files()
-            health_status = self.check_processing_health()
+            health_status = self.check_processing_health(file_analysis, system_metrics)
             
             # Record progress snapshot
-            self.record_progress_snapshot()
+            self.record_progress_snapshot(analysis=file_analysis, system_metrics=system_metrics)
             
             # Check for alerts
             if health_status['overall_status'] == 'critical':
@@ -501,8 +783,9 @@ class UltimateProgressMonitor:
 
     def display_comprehensive_dashboard(self, results: Dict):
         """Display comprehensive real-time dashboard."""
-        # Clear screen for real-time updates
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Render the whole frame in memory, then clear and redraw with a single write
+        # so the terminal never shows a half-drawn dashboard
+        out = io.StringIO()
         
         print(f"""
 ╔══════════════════════════════════════════════════════════════════╗
@@ -511,133 +794,155 @@ class UltimateProgressMonitor:
 ║  📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Case: FDSJ-739-24                        ║
 ║  ⏱️ Session: {results.get('session_stats', {}).get('session_duration_minutes', 0):.0f} min | Cycles: {results.get('session_stats', {}).get('monitoring_cycles', 0)}              ║
 ╚══════════════════════════════════════════════════════════════════╝
-        """)
+        """, file=out)
         
         # System Health Status
         health = results.get('health_status', {})
-        status_icon = {
-            'healthy': '🟢',
-            'warning': '🟡', 
-            'critical': '🔴',
-            'error': '⚫',
-            'unknown': '⚪'
-        }.get(health.get('overall_status', 'unknown'), '⚪')
+        status_icon = STATUS_ICONS.get(health.get('overall_status', 'unknown'), '⚪')
         
-        print(f"🏥 SYSTEM HEALTH: {status_icon} {health.get('overall_status', 'unknown').upper()}")
+        print(f"🏥 SYSTEM HEALTH: {status_icon} {health.get('overall_status', 'unknown').upper()}", file=out)
         
         if health.get('issues'):
-            print("⚠️ Issues Detected:")
+            print("⚠️ Issues Detected:", file=out)
             for issue in health['issues'][:3]:  # Show top 3 issues
-                print(f"   • {issue}")
+                print(f"   • {issue}", file=out)
         
         if health.get('recommendations'):
-            print("💡 Recommendations:")
+            print("💡 Recommendations:", file=out)
             for rec in health['recommendations'][:2]:  # Show top 2 recommendations
-                print(f"   • {rec}")
+                print(f"   • {rec}", file=out)
         
-        print()
+        print(file=out)
         
         # Processing Progress
-        print("📊 PROCESSING PROGRESS:")
+        print("📊 PROCESSING PROGRESS:", file=out)
         file_analysis = results.get('file_analysis', {})
         
-        processing_types = [
-            ('OCR Processing', 'ocr_processing', '🔍'),
-            ('Enhanced Quality', 'enhanced_processing', '💎'),
-            ('Secure Processing', 'secure_processing', '🔐'),
-            ('Advanced Processing', 'advanced_processing', '📄')
-        ]
-        
-        for name, key, icon in processing_types:
+        for name, key, icon in PROCESSING_TYPES:
             data = file_analysis.get(key, {})
             if data.get('total_records', 0) > 0:
-                print(f"   {icon} {name}: {data['total_records']} records ({data['file_count']} files)")
+                print(f"   {icon} {name}: {data['total_records']} records ({data['file_count']} files)", file=out)
                 if data.get('latest_file'):
                     latest = data['latest_file']
                     minutes_ago = (datetime.now() - latest['modified']).total_seconds() / 60
-                    print(f"      Latest: {latest['name']} ({minutes_ago:.0f} min ago)")
+                    print(f"      Latest: {latest['name']} ({minutes_ago:.0f} min ago)", file=out)
         
-        print(f"\n📈 Total Records Processed: {file_analysis.get('total_records', 0)}")
+        print(f"\n📈 Total Records Processed: {file_analysis.get('total_records', 0)}", file=out)
         
         # Evidence Inventory
         evidence = results.get('evidence_inventory', {})
         if evidence.get('total', 0) > 0:
-            print(f"\n📁 EVIDENCE INVENTORY:")
-            print(f"   📊 Total Files: {evidence['total']}")
+            print(f"\n📁 EVIDENCE INVENTORY:", file=out)
+            print(f"   📊 Total Files: {evidence['total']}", file=out)
             
             by_type = evidence.get('by_type', {})
             if by_type:
-                type_icons = {
-                    'images': '🖼️',
-                    'documents': '📄',
-                    'videos': '🎬',
-                    'audio': '🔊',
-                    'other': '📁'
-                }
-                
                 for file_type, count in by_type.items():
                     if count > 0:
-                        icon = type_icons.get(file_type, '📁')
-                        print(f"   {icon} {file_type.title()}: {count}")
+                        icon = TYPE_ICONS.get(file_type, '📁')
+                        print(f"   {icon} {file_type.title()}: {count}", file=out)
         
         # System Performance
         metrics = results.get('system_metrics', {})
         if metrics:
-            print(f"\n💻 SYSTEM PERFORMANCE:")
-            print(f"   🖥️ CPU Usage: {metrics.get('cpu_usage', 0):.1f}%")
-            print(f"   🧠 Memory Usage: {metrics.get('memory_usage', 0):.1f}% ({metrics.get('memory_available_gb', 0):.1f} GB free)")
-            print(f"   💾 Disk Usage: {metrics.get('disk_usage', 0):.1f}% ({metrics.get('disk_free_gb', 0):.1f} GB free)")
-            print(f"   ⚙️ Active Processes: {metrics.get('active_processes', 0)}")
+            print(f"\n💻 SYSTEM PERFORMANCE:", file=out)
+            print(f"   🖥️ CPU Usage: {metrics.get('cpu_usage', 0):.1f}%", file=out)
+            print(f"   🧠 Memory Usage: {metrics.get('memory_usage', 0):.1f}% ({metrics.get('memory_available_gb', 0):.1f} GB free)", file=out)
+            print(f"   💾 Disk Usage: {metrics.get('disk_usage', 0):.1f}% ({metrics.get('disk_free_gb', 0):.1f} GB free)", file=out)
+            print(f"   ⚙️ Active Processes: {metrics.get('active_processes', 0)}", file=out)
         
         # Recent Alerts
         if hasattr(self, 'stats') and self.stats.get('alerts'):
-            recent_alerts = self.stats['alerts'][-3:]  # Last 3 alerts
-            print(f"\n🚨 RECENT ALERTS:")
+            alerts = self.stats['alerts']
+            # Last 3 alerts; indexing near either end of a deque is O(1)
+            recent_alerts = [alerts[i] for i in range(max(len(alerts) - 3, 0), len(alerts))]
+            print(f"\n🚨 RECENT ALERTS:", file=out)
             for alert in recent_alerts:
-                severity_icon = {'HIGH': '🔴', 'MEDIUM': '🟡', 'LOW': '🟢'}.get(alert['severity'], '⚪')
+                severity_icon = SEVERITY_ICONS.get(alert['severity'], '⚪')
                 minutes_ago = (datetime.now() - alert['timestamp']).total_seconds() / 60
-                print(f"   {severity_icon} {alert['type']}: {alert['message']} ({minutes_ago:.0f}m ago)")
+                print(f"   {severity_icon} {alert['type']}: {alert['message']} ({minutes_ago:.0f}m ago)", file=out)
         
         # Processing Rate
         processing_rate = health.get('processing_rate', 0)
         if processing_rate > 0:
-            print(f"\n⚡ Processing Rate: {processing_rate:.1f} records/hour")
+            print(f"\n⚡ Processing Rate: {processing_rate:.1f} records/hour", file=out)
+        
+        print("\n" + "="*70, file=out)
+        print("💡 Press Ctrl+C to stop monitoring | Updates every 5 seconds", file=out)
+        print("="*70, file=out)
         
-        print("\n" + "="*70)
-        print("💡 Press Ctrl+C to stop monitoring | Updates every 5 seconds")
-        print("="*70)
+        sys.stdout.write(CLEAR_SCREEN + out.getvalue())
+        sys.stdout.flush()
 
     def run_continuous_monitoring(self):
         """Run continuous monitoring with real-time dashboard."""
         self.log_message("Starting continuous monitoring mode...")
         
+        # Checks run on a background thread and hand over only their newest result,
+        # so drawing the dashboard never waits on globbing, CSV scans or database writes
+        latest_results = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        checker = threading.Thread(target=self._check_loop, args=(latest_results, stop), daemon=True)
+        
         try:
-            cycle_count = 0
+            checker.start()
             
             while True:
-                cycle_count += 1
-                
-                # Perform comprehensive check
-                results = self.check_all_processing()
+                try:
+                    results = latest_results.get(timeout=DISPLAY_POLL_INTERVAL)
+                except queue.Empty:
+                    if not checker.is_alive():
+                        raise RuntimeError("background checks stopped unexpectedly")
+                    continue
                 
                 # Display dashboard
                 self.display_comprehensive_dashboard(results)
                 
-                # Wait for next cycle
-                time.sleep(self.monitor_config['refresh_interval'])
-                
         except KeyboardInterrupt:
             print("\n\n🛑 Monitoring stopped by user")
             self.log_message("Continuous monitoring stopped by user")
         except Exception as e:
             print(f"\n❌ Monitoring error: {e}")
             self.logger.error(f"Continuous monitoring failed: {e}")
+        finally:
+            # Let a check in progress finish before the final write from this thread
+            stop.set()
+            if checker.is_alive():
+                checker.join()
+            self.flush_pending()
+
+    def _check_loop(self, latest_results: queue.Queue, stop: threading.Event):
+        """Run comprehensive checks every refresh interval until stopped."""
+        interval = self.monitor_config['refresh_interval']
+        next_tick = time.monotonic()
+        
+        while not stop.is_set():
+            # Perform comprehensive check
+            results = self.check_all_processing()
+            
+            # Single slot: a result the dashboard hasn't drawn yet is replaced, not queued
+            try:
+                latest_results.get_nowait()
+            except queue.Empty:
+                pass
+            latest_results.put(results)
+            
+            # Wait for next cycle, timed from the start of this one so the check itself doesn't add drift
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay <= 0:
+                # Overran: start the next cycle now rather than racing to catch up
+                self.log_message(f"Monitoring cycle took {interval - delay:.1f}s, longer than the {interval}s refresh interval", 'WARNING')
+                next_tick = time.monotonic()
+                delay = 0
+            stop.wait(delay)
 
     def run_single_check(self):
         """Run a single comprehensive check and display results."""
         print("🔍 Performing single comprehensive system check...")
         
         results = self.check_all_processing()
+        self.flush_pending()
         self.display_comprehensive_dashboard(results)
         
         print("\n✅ Single check completed!")
@@ -650,38 +955,30 @@ class UltimateProgressMonitor:
             # Get current status
             results = self.check_all_processing()
             
-            # Get historical data from database
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT * FROM progress_snapshots 
-                WHERE timestamp >= datetime('now', '-24 hours')
-                ORDER BY timestamp DESC
-            ''')
-            
-            historical_snapshots = cursor.fetchall()
+            # Get historical data from database, including snapshots and alerts still queued
+            self.flush_pending()
+            # Timestamps are stored as local isoformat() text, so the cutoff uses the same form
+            cutoff = (datetime.now() - timedelta(hours=24)).isoformat()
+            trend_summary = self.fetch_trend_summary(cutoff)
             
             # Get recent alerts
-            cursor.execute('''
-                SELECT * FROM alerts 
-                WHERE timestamp >= datetime('now', '-24 hours')
-                ORDER BY timestamp DESC
-            ''')
-            
-            recent_alerts = cursor.fetchall()
+            recent_alerts = self._cur.execute(
+                'SELECT COUNT(*) FROM alerts WHERE timestamp >= ?', (cutoff,)
+            ).fetchone()[0]
             
             # Compile comprehensive report
             report = {
                 'report_timestamp': datetime.now().isoformat(),
                 'current_status': results,
-                'historical_snapshots_24h': len(historical_snapshots),
-                'recent_alerts_24h': len(recent_alerts),
-                'trends': self.calculate_trends(historical_snapshots),
+                'historical_snapshots_24h': trend_summary[0],
+                'recent_alerts_24h': recent_alerts,
+                'trends': self.calculate_trends(trend_summary),
                 'recommendations': self.generate_recommendations(results),
                 'session_summary': {
                     'session_start': self.stats['session_start'].isoformat(),
                     'session_duration_hours': (datetime.now() - self.stats['session_start']).total_seconds() / 3600,
                     'monitoring_cycles': getattr(self, 'monitoring_cycles', 0),
-                    'alerts_generated': len(self.stats.get('alerts', []))
+                    'alerts_generated': self.stats['alerts_generated']
                 }
             }
             
@@ -697,31 +994,24 @@ class UltimateProgressMonitor:
             self.logger.error(f"Failed to generate monitoring report: {e}")
             return {'error': str(e)}
 
-    def calculate_trends(self, snapshots: List) -> Dict:
-        """Calculate trends from historical snapshots."""
-        if len(snapshots) < 2:
+    def fetch_trend_summary(self, cutoff: str) -> Tuple:
+        """Snapshot count and per-column aggregates since cutoff, as one TREND_QUERY row."""
+        return self._cur.execute(TREND_QUERY, {'cutoff': cutoff}).fetchone()
+
+    def calculate_trends(self, summary: Tuple) -> Dict:
+        """Calculate trends from a fetch_trend_summary() row."""
+        if summary[0] < 2:
             return {'insufficient_data': True}
         
         try:
-            # Extract data points
-            cpu_usage = [row[7] for row in snapshots if row[7] is not None]
-            memory_usage = [row[6] for row in snapshots if row[6] is not None]
-            processing_rate = [row[5] for row in snapshots if row[5] is not None]
-            
             trends = {}
             
             # Calculate simple trends (increasing/decreasing)
-            if len(cpu_usage) >= 2:
-                trends['cpu_trend'] = 'increasing' if cpu_usage[0] > cpu_usage[-1] else 'decreasing'
-                trends['avg_cpu'] = sum(cpu_usage) / len(cpu_usage)
-            
-            if len(memory_usage) >= 2:
-                trends['memory_trend'] = 'increasing' if memory_usage[0] > memory_usage[-1] else 'decreasing'
-                trends['avg_memory'] = sum(memory_usage) / len(memory_usage)
-            
-            if len(processing_rate) >= 2:
-                trends['processing_trend'] = 'increasing' if processing_rate[0] > processing_rate[-1] else 'decreasing'
-                trends['avg_processing_rate'] = sum(processing_rate) / len(processing_rate)
+            for i, (_, trend_key, avg_key) in enumerate(TREND_COLUMNS):
+                count, average, newest, oldest = summary[1 + 4 * i:5 + 4 * i]
+                if count >= 2:
+                    trends[trend_key] = 'increasing' if newest > oldest else 'decreasing'
+                    trends[avg_key] = average
             
             return trends
             
@@ -731,75 +1021,57 @@ class UltimateProgressMonitor:
 
     def generate_recommendations(self, results: Dict) -> List[str]:
         """Generate intelligent recommendations based on current status."""
-        recommendations = []
-        
         try:
-            # System performance recommendations
-            metrics = results.get('system_metrics', {})
-            if metrics.get('memory_usage', 0) > 80:
-                recommendations.append("High memory usage detected - consider reducing batch sizes")
-            
-            if metrics.get('cpu_usage', 0) > 90:
-                recommendations.append("High CPU usage - consider running fewer concurrent processes")
-            
-            if metrics.get('disk_usage', 0) > 85:
-                recommendations.append("Low disk space - run cleanup or add storage")
-            
-            # Processing recommendations
-            file_analysis = results.get('file_analysis', {})
-            if file_analysis.get('total_records', 0) == 0:
-                recommendations.append("No processing activity detected - check if processors are running")
-            
-            # Health-based recommendations
-            health = results.get('health_status', {})
-            if health.get('last_activity_minutes', 0) > 30:
-                recommendations.append("Long period without processing activity - verify system status")
-            
-            # Evidence recommendations
-            evidence = results.get('evidence_inventory', {})
-            if evidence.get('total', 0) == 0:
-                recommendations.append("No evidence files found - verify evidence directory structure")
-            
-            return recommendations
+            return [message for section, key, compare, threshold, message in RECOMMENDATION_RULES
+                    if compare(results.get(section, {}).get(key, 0), threshold)]
             
         except Exception as e:
             self.logger.error(f"Failed to generate recommendations: {e}")
             return ["Error generating recommendations"]
 
-    def __del__(self):
-        """Cleanup database connection."""
-        if hasattr(self, 'conn'):
-            self.conn.close()
+    def close(self):
+        """Write any queued rows and close the database connection; safe to call twice."""
+        if getattr(self, 'conn', None) is None:
+            return
+        self.flush_pending()
+        self.conn.close()
+        self.conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 def main():
     """Main monitoring execution with command line options."""
     try:
-        monitor = UltimateProgressMonitor()
-        
-        # Check command line arguments
-        if len(sys.argv) > 1:
-            mode = sys.argv[1].lower()
+        with UltimateProgressMonitor() as monitor:
             
-            if mode == 'continuous' or mode == 'monitor':
-                monitor.run_continuous_monitoring()
-            elif mode == 'check' or mode == 'single':
-                monitor.run_single_check()
-            elif mode == 'report':
-                report = monitor.generate_monitoring_report()
-                if 'error' not in report:
-                    print("📊 Monitoring report generated successfully!")
+            # Check command line arguments
+            if len(sys.argv) > 1:
+                mode = sys.argv[1].lower()
+                
+                if mode == 'continuous' or mode == 'monitor':
+                    monitor.run_continuous_monitoring()
+                elif mode == 'check' or mode == 'single':
+                    monitor.run_single_check()
+                elif mode == 'report':
+                    report = monitor.generate_monitoring_report()
+                    if 'error' not in report:
+                        print("📊 Monitoring report generated successfully!")
+                    else:
+                        print(f"❌ Report generation failed: {report['error']}")
                 else:
-                    print(f"❌ Report generation failed: {report['error']}")
+                    print("❌ Invalid mode. Use: continuous, check, or report")
             else:
-                print("❌ Invalid mode. Use: continuous, check, or report")
-        else:
-            # Default to continuous monitoring
-            print("🎮 Starting continuous monitoring mode (default)")
-            print("💡 Use 'python ultimate_progress_monitor.py check' for single check")
-            print("💡 Use 'python ultimate_progress_monitor.py report' for report generation")
-            time.sleep(2)
-            monitor.run_continuous_monitoring()
+                # Default to continuous monitoring
+                print("🎮 Starting continuous monitoring mode (default)")
+                print("💡 Use 'python ultimate_progress_monitor.py check' for single check")
+                print("💡 Use 'python ultimate_progress_monitor.py report' for report generation")
+                time.sleep(2)
+                monitor.run_continuous_monitoring()
     
     except KeyboardInterrupt:
         print("\n👋 Ultimate Progress Monitor terminated by user")
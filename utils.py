@@ -3,70 +3,101 @@ import streamlit as st
 import pandas as pd
 import re
 import os
+from parquet_mirror import load_with_mirror
+
+EXHIBITS_PATH = 'CUSTODY_COURT_EXHIBITS.txt'
+EXHIBITS_MIRROR_VERSION = 1  # bump when _parse_exhibits or its columns change
+
+# Category heading, folder line or file line: one match attempt per line,
+# with the named group that matched telling them apart
+EXHIBIT_LINE_RE = re.compile(r'^(?:(?P<category>(?i:.* EVIDENCE)):$|📁 FOLDER: (?P<folder>.*)|📄 (?P<file>.*))')
 
-@st.cache_data
 def load_exhibit_data():
     """
     Parses the CUSTODY_COURT_EXHIBITS.txt file and returns a pandas DataFrame.
-    This function is cached to ensure the data is loaded only once.
+    The result is cached per version of the file (keyed on its mtime), so an
+    edited file is re-parsed on the next rerun and an unchanged one never is.
     """
     try:
-        with open('CUSTODY_COURT_EXHIBITS.txt', 'r', encoding='utf-8') as f:
-            file_content = f.read()
+        mtime = os.path.getmtime(EXHIBITS_PATH)
     except FileNotFoundError:
         # The calling function should handle this error
         return pd.DataFrame()
+    return _load_exhibit_data(EXHIBITS_PATH, mtime)
+
+@st.cache_data(show_spinner=False)
+def _load_exhibit_data(path, mtime):
+    """
+    Parsed exhibits through a Parquet mirror kept next to the text file, so a
+    fresh process skips the parse too; without PyArrow the text is parsed.
+    """
+    return load_with_mirror(path, lambda: _parse_exhibits(path), EXHIBITS_MIRROR_VERSION)
+
+def _parse_exhibits(path):
+    """Parses the exhibits text file into a DataFrame indexed by Exhibit ID.
 
-    exhibits = []
+    The file is read a line at a time. A file line opens a pending exhibit whose
+    Context, From and Score come from the three lines that follow it.
+    """
+    # (folder, file, context) -> row; the first occurrence of a repeated exhibit wins
+    rows = {}
     current_category = "Uncategorized"
     current_folder = "Uncategorized"
-    seen_exhibits = set()
+    # [category, folder, filename, then the lines read since the file line]
+    pending = None
 
-    lines = file_content.splitlines()
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
-            continue
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
 
-        category_match = re.match(r'^(.* EVIDENCE):$', line, re.IGNORECASE)
-        if category_match:
-            category_title = category_match.group(1).title().replace("'S", "'s")
-            current_category = category_title
-            continue
+            if pending is not None:
+                pending.append(line)
+                if len(pending) == 6:
+                    category, folder, filename, context, from_who, score_str = pending
+                    pending = None
+                    context = context.removeprefix('Context: ')
+                    try:
+                        score = float(score_str.removeprefix('Score: '))
+                    except ValueError:
+                        pass
+                    else:
+                        rows.setdefault((folder, filename, context),
+                                        (category, folder, filename, score, context,
+                                         from_who.removeprefix('From: ')))
 
-        folder_match = re.match(r'📁 FOLDER: (.*)', line)
-        if folder_match:
-            current_folder = folder_match.group(1)
-            continue
+            if not line:
+                continue
 
-        file_match = re.match(r'📄 (.*)', line)
-        if file_match:
-            try:
-                filename = file_match.group(1)
-                context = lines[i+1].strip().replace('Context: ', '')
-                from_who = lines[i+2].strip().replace('From: ', '')
-                score_str = lines[i+3].strip().replace('Score: ', '')
-                score = float(score_str)
+            line_match = EXHIBIT_LINE_RE.match(line)
+            if not line_match:
+                continue
+            kind = line_match.lastgroup
 
-                exhibit_key = (current_folder, filename, context)
-                if exhibit_key in seen_exhibits:
-                    continue
-                seen_exhibits.add(exhibit_key)
+            if kind == 'category':
+                category_title = line_match['category'].title().replace("'S", "'s")
+                current_category = category_title
+            elif kind == 'folder':
+                current_folder = line_match['folder']
+            else:
+                pending = [current_category, current_folder, line_match['file']]
 
-                exhibits.append({
-                    'Category': current_category,
-                    'Folder': current_folder,
-                    'File': filename,
-                    'Score': score,
-                    'Context': context,
-                    'Source': from_who,
-                    'Path': os.path.join(current_folder, filename).replace('\\', '/')
-                })
-            except (IndexError, ValueError):
-                pass
+    if not rows:
+        return pd.DataFrame()
 
-    df = pd.DataFrame(exhibits)
-    if not df.empty:
-        df['Exhibit ID'] = [f"A-{i+1}" for i in range(len(df))]
-        df.set_index('Exhibit ID', inplace=True)
+    categories, folders, files, scores, contexts, sources = zip(*rows.values())
+    # Folders are Windows paths; convert each distinct one once rather than every joined path
+    posix_folders = {folder: folder.replace('\\', '/') for folder in set(folders)}
+    df = pd.DataFrame({
+        'Category': categories,
+        'Folder': folders,
+        'File': files,
+        'Score': scores,
+        'Context': contexts,
+        'Source': sources,
+        'Path': [f"{posix_folders[folder]}/{filename}" for folder, filename in zip(folders, files)]
+    })
+    # A handful of distinct categories, folders and senders: store them as integer codes
+    df = df.astype({'Category': 'category', 'Folder': 'category', 'Source': 'category'})
+    df.index = 'A-' + pd.RangeIndex(1, len(df) + 1).astype(str)
+    df.index.name = 'Exhibit ID'
     return df
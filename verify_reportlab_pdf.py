@@ -3,14 +3,26 @@ from reportlab.lib.pagesizes import letter
 from pathlib import Path
 
 out_dir = Path('output')
-out_dir.mkdir(parents=True, exist_ok=True)
-
 pdf_path = out_dir / '_test_reportlab.pdf'
 
-c = canvas.Canvas(str(pdf_path), pagesize=letter)
-width, height = letter
-c.setFont('Helvetica', 14)
-c.drawString(72, height - 72, 'ReportLab OK: test PDF generated successfully.')
-c.save()
 
-print(f'Wrote: {pdf_path.resolve()}')
+def verify(path: Path = pdf_path) -> Path:
+    """Write a one-line test PDF with ReportLab and return its path.
+
+    Skipped when the PDF is already newer than this script, so repeated runs
+    don't rebuild an identical file.
+    """
+    if path.exists() and path.stat().st_mtime > Path(__file__).stat().st_mtime:
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    c = canvas.Canvas(str(path), pagesize=letter)
+    width, height = letter
+    c.setFont('Helvetica', 14)
+    c.drawString(72, height - 72, 'ReportLab OK: test PDF generated successfully.')
+    c.save()
+    return path
+
+
+if __name__ == "__main__":
+    print(f'Wrote: {verify().resolve()}')